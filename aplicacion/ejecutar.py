@@ -21,29 +21,54 @@ if src_dir not in sys.path:
     sys.path.append(src_dir)
 
 try:
-    from funciones.inicializar import init_db
+    from funciones.inicializar import init_db, sincronizar_subgrupos
     from funciones.vista import *
     from funciones.estadisticas import *
     from funciones.utilidades import *
     from funciones.carga_datos import *
     from funciones.busqueda import *
-    from funciones import cliente_api
-    from funciones.modo_api import *
 except ImportError as e:
     print(f"⚠️ Error: No se pudo importar módulos desde 'funciones': {e}")
     print(f"   Raíz del proyecto calculada: {project_root}")
     sys.exit(1)
 
-db_path = init_db(project_root)
+db_path = init_db(project_root, sincronizar=False)
 if db_path is None:
     print("⚠️ Error: No se pudo inicializar la base de datos.")
     sys.exit(1)
 
 colegios = leer_csv(db_path)
+# Los subgrupos se clasifican desde la lista ya leída, sin recorrer el CSV otra vez
+sincronizar_subgrupos(db_path, colegios)
 
 # Indicador global de modo de operación. False = local, True = API.
 MODO_API = False
 
+# Módulos del modo API. Se importan recién al elegir ese modo porque cargan
+# `requests`, que es lento de importar y no se necesita en modo local.
+cliente_api = None
+modo_api = None
+
+
+def cargar_modo_api() -> bool:
+    """Importa los módulos del modo API la primera vez que se usan.
+
+    Returns:
+        bool: True si los módulos están disponibles, False en caso contrario.
+    """
+    global cliente_api, modo_api
+    if modo_api is not None:
+        return True
+    try:
+        from funciones import cliente_api as _cliente_api
+        from funciones import modo_api as _modo_api
+    except ImportError as e:
+        print(f"   ⚠️ No se pudo cargar el modo API: {e}")
+        return False
+    cliente_api = _cliente_api
+    modo_api = _modo_api
+    return True
+
 
 def elegir_modo():
     """Permite al usuario elegir entre modo local y modo API."""
@@ -55,8 +80,10 @@ def elegir_modo():
         MODO_API = False
         print("\n✅ Modo: Archivo CSV local")
         print(f"   Ubicación: {db_path}")
-        # Recargar datos locales
+        # Recargar datos locales (después de la última sincronización con la API)
         global colegios
+        if modo_api is not None:
+            modo_api.esperar_sincronizacion()
         colegios = leer_csv(db_path)
         if colegios:
             print(f"   ✅ Se cargaron {len(colegios)} colegio(s).")
@@ -68,6 +95,11 @@ def elegir_modo():
         MODO_API = True
         print("\n✅ Modo: Servidor API remoto")
         print(f"   URL: http://149.50.150.15:8020")
+        if not cargar_modo_api():
+            print("   Se volverá a modo local automáticamente...")
+            MODO_API = False
+            colegios = leer_csv(db_path)
+            return True
         try:
             estado = cliente_api.estado_servidor()
             print(f"   ✅ Conexión exitosa: {estado.get('status', 'OK')}")
@@ -89,10 +121,87 @@ def elegir_modo():
         return elegir_modo()
 
 
+MENSAJE_NOMBRE = "\n📝 Ingrese el nombre del colegio a buscar: "
+MENSAJE_PROVINCIA = "\n🗺️  Ingrese la provincia: "
+
+
+def con_texto(mensaje: str, accion) -> None:
+    """Pide un texto y, si no está vacío, ejecuta la acción con él.
+
+    Args:
+        mensaje (str): Mensaje a mostrar al pedir el texto.
+        accion (callable): Función que recibe el texto ingresado.
+    """
+    texto = input(mensaje).strip()
+    if texto:
+        accion(texto)
+
+
+def con_rango(nombre_campo: str, accion) -> None:
+    """Pide un rango y, si es válido, ejecuta la acción con mínimo y máximo.
+
+    Args:
+        nombre_campo (str): Nombre del campo para el mensaje.
+        accion (callable): Función que recibe (mínimo, máximo).
+    """
+    minimo, maximo = pedir_rango(nombre_campo)
+    if minimo is not None and maximo is not None:
+        accion(minimo, maximo)
+
+
+def con_orden(accion) -> None:
+    """Pide campo y sentido de orden y, si hay campo, ejecuta la acción.
+
+    Args:
+        accion (callable): Función que recibe (campo, descendente).
+    """
+    print("\n📊 Campos disponibles para ordenar:")
+    print("   - Provincia")
+    print("   - Colegio")
+    print("   - Cantidad de Estudiantes")
+    print("   - Año de Creación")
+    campo = input("\n🔢 Ingrese el campo por el cual ordenar: ").strip()
+    orden = input("⬇️  ¿Orden descendente? (s/n): ").strip().lower()
+    if campo:
+        accion(campo, orden == 's')
+
+
+def ordenar_y_mostrar(campo: str, descendente: bool) -> None:
+    """Ordena los colegios locales y los muestra."""
+    mostrar_colegios(ordenar_colegios(colegios, campo, descendente))
+
+
+# Tablas de despacho: opción del menú -> acción, una por modo. Las lambdas
+# leen `colegios` y `modo_api` al ejecutarse, así que siguen valiendo después
+# de recargar datos o de cambiar de modo. Las operaciones CRUD locales dejan
+# la lista en memoria actualizada (o revertida si fallan).
+OPERACIONES_LOCAL = {
+    1: lambda: con_texto(MENSAJE_NOMBRE, lambda nombre: buscar_colegio(colegios, nombre)),
+    2: lambda: con_texto(MENSAJE_PROVINCIA, lambda provincia: filtrar_por_provincia(colegios, provincia)),
+    3: lambda: con_rango("cantidad de estudiantes", lambda a, b: filtrar_por_rango_estudiantes(colegios, a, b)),
+    4: lambda: con_rango("año de creación", lambda a, b: filtrar_por_rango_año(colegios, a, b)),
+    5: lambda: con_orden(ordenar_y_mostrar),
+    6: lambda: mostrar_estadisticas(colegios),
+    7: lambda: agregar_colegio(colegios, db_path),
+    8: lambda: editar_colegio(colegios, db_path),
+    9: lambda: borrar_colegio(colegios, db_path),
+}
+
+OPERACIONES_API = {
+    1: lambda: con_texto(MENSAJE_NOMBRE, modo_api.buscar_colegio_api),
+    2: lambda: con_texto(MENSAJE_PROVINCIA, modo_api.filtrar_provincia_api),
+    3: lambda: con_rango("cantidad de estudiantes", modo_api.filtrar_rango_estudiantes_api),
+    4: lambda: con_rango("año de creación", modo_api.filtrar_rango_año_api),
+    5: lambda: con_orden(modo_api.ordenar_colegios_api),
+    6: lambda: modo_api.estadisticas_api(),
+    7: lambda: modo_api.agregar_colegio_api(),
+    8: lambda: modo_api.editar_colegio_api(),
+    9: lambda: modo_api.borrar_colegio_api(),
+}
+
+
 def main():
     """Función principal que ejecuta el bucle del menú."""
-    global colegios, MODO_API
-
     print("=" * 70)
     print("🏫 SISTEMA DE GESTIÓN Y CONSULTA DE COLEGIOS 🏫")
     print("=" * 70)
@@ -104,94 +213,11 @@ def main():
         try:
             opcion = menu_principal()
 
-            if opcion == 1:
-                # Buscar colegio por nombre
-                if MODO_API:
-                    nombre = input("\n📝 Ingrese el nombre del colegio a buscar: ").strip()
-                    if nombre:
-                        buscar_colegio_api(nombre)
-                else:
-                    nombre = input("\n📝 Ingrese el nombre del colegio a buscar: ").strip()
-                    if nombre:
-                        buscar_colegio(colegios, nombre)
-
-            elif opcion == 2:
-                # Filtrar por provincia
-                if MODO_API:
-                    provincia = input("\n🗺️  Ingrese la provincia: ").strip()
-                    if provincia:
-                        filtrar_provincia_api(provincia)
-                else:
-                    provincia = input("\n🗺️  Ingrese la provincia: ").strip()
-                    if provincia:
-                        filtrar_por_provincia(colegios, provincia)
-
-            elif opcion == 3:
-                # Filtrar por rango de cantidad de estudiantes
-                minimo, maximo = pedir_rango("cantidad de estudiantes")
-                if minimo is not None and maximo is not None:
-                    if MODO_API:
-                        filtrar_rango_estudiantes_api(minimo, maximo)
-                    else:
-                        filtrar_por_rango_estudiantes(colegios, minimo, maximo)
-
-            elif opcion == 4:
-                # Filtrar por rango de año de creación
-                minimo, maximo = pedir_rango("año de creación")
-                if minimo is not None and maximo is not None:
-                    if MODO_API:
-                        filtrar_rango_año_api(minimo, maximo)
-                    else:
-                        filtrar_por_rango_año(colegios, minimo, maximo)
-
-            elif opcion == 5:
-                # Ordenar colegios
-                print("\n📊 Campos disponibles para ordenar:")
-                print("   - Provincia")
-                print("   - Colegio")
-                print("   - Cantidad de Estudiantes")
-                print("   - Año de Creación")
-                campo = input("\n🔢 Ingrese el campo por el cual ordenar: ").strip()
-                orden = input("⬇️  ¿Orden descendente? (s/n): ").strip().lower()
-                descendente = orden == 's'
-
-                if campo:
-                    if MODO_API:
-                        ordenar_colegios_api(campo, descendente)
-                    else:
-                        colegios_ordenados = ordenar_colegios(colegios, campo, descendente)
-                        mostrar_colegios(colegios_ordenados)
-
-            elif opcion == 6:
-                # Mostrar estadísticas
-                if MODO_API:
-                    estadisticas_api()
-                else:
-                    mostrar_estadisticas(colegios)
-
-            elif opcion == 7:
-                # Agregar un colegio
-                if MODO_API:
-                    agregar_colegio_api()
-                else:
-                    if agregar_colegio(colegios, db_path):
-                        colegios = leer_csv(db_path)
-
-            elif opcion == 8:
-                # Editar un colegio
-                if MODO_API:
-                    editar_colegio_api()
-                else:
-                    if editar_colegio(colegios, db_path):
-                        colegios = leer_csv(db_path)
-
-            elif opcion == 9:
-                # Borrar colegio
-                if MODO_API:
-                    borrar_colegio_api()
-                else:
-                    if borrar_colegio(colegios, db_path):
-                        colegios = leer_csv(db_path)
+            operaciones = OPERACIONES_API if MODO_API else OPERACIONES_LOCAL
+            operacion = operaciones.get(opcion)
+
+            if operacion is not None:
+                operacion()
 
             elif opcion == 10:
                 # Cambiar modo de servidor
@@ -219,6 +245,10 @@ def main():
             import traceback
             traceback.print_exc()
 
+    if cliente_api is not None:
+        modo_api.esperar_sincronizacion()
+        cliente_api.cerrar_sesion()
+
 
 if __name__ == "__main__":
     main()
@@ -1,19 +1,135 @@
 """Funciones de búsqueda y filtrado de colegios."""
 
-from typing import List, Dict
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
 from funciones.utilidades import normalizar
 from funciones.vista import mostrar_colegios
 
 
-def buscar_colegio_recursivo(colegios: List[Dict], nombre: str, indice: int = 0, resultados: List[Dict] = None) -> List[Dict]:
-    """Busca colegios de forma recursiva que contengan el texto ingresado en el nombre.
+# Caché de búsquedas recientes (consulta normalizada -> resultados).
+# Solo es válida para la lista `_cache_lista`; si cambia, se descarta.
+_CACHE_MAX = 8
+_cache: "OrderedDict[str, List[Dict]]" = OrderedDict()
+_cache_lista: Optional[List[Dict]] = None
+
+# Nombres normalizados de `_cache_lista` concatenados con un separador, y la
+# posición donde empieza cada uno. Se construye de forma perezosa.
+_SEPARADOR = "\x00"
+_corpus: Optional[str] = None
+_corpus_inicios: List[int] = []
+
+# Índices ordenados para los filtros por rango: campo -> (valores ordenados,
+# posición de cada valor en `_indices_lista`). Se arman recién cuando la misma
+# lista se filtra por segunda vez, para no pagar el ordenamiento en listas que
+# se consultan una sola vez (ej.: las que llegan de la API).
+_indices_rango: Dict[str, Tuple[List[int], List[int]]] = {}
+_indices_lista: Optional[List[Dict]] = None
+
+
+def invalidar_cache_busqueda() -> None:
+    """Descarta las búsquedas recientes y los índices de rango guardados.
+
+    Debe llamarse antes de modificar la lista de colegios (agregar, editar o borrar).
+    """
+    global _cache_lista, _corpus, _indices_lista
+    _cache.clear()
+    _cache_lista = None
+    _corpus = None
+    _indices_rango.clear()
+    _indices_lista = None
 
-    Implementación recursiva para cumplir con los requisitos del proyecto.
+
+def _buscar_en_corpus(colegios: List[Dict], nombre_buscar: str) -> List[Dict]:
+    """Busca en todos los nombres con `str.find` sobre un único texto concatenado.
+
+    El recorrido lo hace `str.find` en C, así que el costo en Python es
+    proporcional a la cantidad de coincidencias y no a la cantidad de colegios.
+
+    Args:
+        colegios (list[dict]): Lista de colegios donde buscar (`_cache_lista`).
+        nombre_buscar (str): Texto a buscar, ya normalizado.
+
+    Returns:
+        list[dict]: Lista de colegios que coinciden con la búsqueda, en orden.
+    """
+    global _corpus, _corpus_inicios
+    if _corpus is None:
+        inicios = []
+        posicion = 0
+        for c in colegios:
+            inicios.append(posicion)
+            posicion += len(c["_n_col"]) + 1
+        _corpus = _SEPARADOR.join(c["_n_col"] for c in colegios)
+        _corpus_inicios = inicios
+
+    resultados = []
+    posicion = _corpus.find(nombre_buscar)
+    while posicion != -1:
+        indice = bisect_right(_corpus_inicios, posicion) - 1
+        resultados.append(colegios[indice])
+        if indice + 1 >= len(_corpus_inicios):
+            break
+        # Continuar desde el próximo nombre para no repetir el mismo colegio
+        posicion = _corpus.find(nombre_buscar, _corpus_inicios[indice + 1])
+    return resultados
+
+
+def _buscar_con_cache(colegios: List[Dict], nombre_buscar: str) -> List[Dict]:
+    """Busca reutilizando los resultados de consultas anteriores.
+
+    Si una consulta previa está contenida en la actual (ej.: "san" y "san martin"),
+    los resultados actuales son un subconjunto de los previos, así que alcanza con
+    filtrar esos en lugar de recorrer toda la lista.
 
     Args:
         colegios (list[dict]): Lista de colegios donde buscar.
+        nombre_buscar (str): Texto a buscar, ya normalizado.
+
+    Returns:
+        list[dict]: Lista de colegios que coinciden con la búsqueda.
+    """
+    global _cache_lista, _corpus
+    if colegios is not _cache_lista:
+        _cache.clear()
+        _cache_lista = colegios
+        _corpus = None
+
+    # Elegir la consulta previa más larga contenida en la actual
+    clave_base = None
+    for clave in _cache:
+        if clave in nombre_buscar and (clave_base is None or len(clave) > len(clave_base)):
+            clave_base = clave
+
+    if not nombre_buscar:
+        resultados = list(colegios)
+    elif clave_base is None:
+        resultados = _buscar_en_corpus(colegios, nombre_buscar)
+    else:
+        _cache.move_to_end(clave_base)
+        resultados = [c for c in _cache[clave_base] if nombre_buscar in c["_n_col"]]
+
+    _cache[nombre_buscar] = resultados
+    _cache.move_to_end(nombre_buscar)
+    if len(_cache) > _CACHE_MAX:
+        _cache.popitem(last=False)
+
+    return list(resultados)
+
+
+def buscar_colegio_recursivo(colegios: List[Dict], nombre: str, indice: int = 0, resultados: List[Dict] = None) -> List[Dict]:
+    """Busca colegios que contengan el texto ingresado en el nombre.
+
+    Conserva el nombre y la firma de la versión recursiva original, pero el
+    recorrido es iterativo para no depender del límite de recursión de Python
+    en listas grandes.
+
+    Args:
+        colegios (list[dict]): Lista de colegios donde buscar (preparados con
+            `preparar_colegio`).
         nombre (str): Texto a buscar.
-        indice (int): Índice actual en la lista (para recursión).
+        indice (int): Índice desde el cual empezar a buscar.
         resultados (list[dict]): Lista acumulativa de resultados.
 
     Returns:
@@ -22,27 +138,14 @@ def buscar_colegio_recursivo(colegios: List[Dict], nombre: str, indice: int = 0,
     if resultados is None:
         resultados = []
 
-    # Caso base: se recorrió toda la lista
-    if indice >= len(colegios):
-        return resultados
-
-    # Procesar el elemento actual
-    colegio_actual = colegios[indice]
-    nombre_colegio = normalizar(colegio_actual.get("Colegio", ""))
     nombre_buscar = normalizar(nombre)
-
-    if nombre_buscar in nombre_colegio:
-        resultados.append(colegio_actual)
-
-    # Llamada recursiva para el siguiente elemento
-    return buscar_colegio_recursivo(colegios, nombre, indice + 1, resultados)
+    resultados.extend(c for c in islice(colegios, indice, None) if nombre_buscar in c["_n_col"])
+    return resultados
 
 
 def buscar_colegio(colegios: List[Dict], nombre: str) -> List[Dict]:
     """Busca colegios que contengan el texto ingresado en el nombre.
 
-    Esta función utiliza la implementación recursiva internamente.
-
     Args:
         colegios (list[dict]): Lista de colegios donde buscar.
         nombre (str): Texto a buscar.
@@ -53,8 +156,7 @@ def buscar_colegio(colegios: List[Dict], nombre: str) -> List[Dict]:
     if not colegios or not nombre:
         return []
 
-    # Usar búsqueda recursiva
-    resultados = buscar_colegio_recursivo(colegios, nombre)
+    resultados = _buscar_con_cache(colegios, normalizar(nombre))
 
     if resultados:
         print(f"\n✅ Se encontraron {len(resultados)} colegio(s) con el nombre '{nombre}':")
@@ -88,7 +190,7 @@ def filtrar_por_provincia(colegios: List[Dict], provincia: str) -> List[Dict]:
     provincia_normalizada = normalizar(provincia)
     resultados = [
         c for c in colegios
-        if provincia_normalizada in normalizar(c.get("Provincia", ""))
+        if provincia_normalizada in c["_n_prov"]
     ]
 
     if resultados:
@@ -100,6 +202,37 @@ def filtrar_por_provincia(colegios: List[Dict], provincia: str) -> List[Dict]:
     return resultados
 
 
+def _filtrar_rango(colegios: List[Dict], campo: str, minimo: int, maximo: int) -> List[Dict]:
+    """Devuelve los colegios cuyo campo numérico está entre mínimo y máximo (inclusive).
+
+    Núcleo compartido por los filtros de estudiantes y de año.
+
+    Args:
+        colegios (list[dict]): Lista de colegios a filtrar.
+        campo (str): 'Cantidad de Estudiantes' o 'Año de Creación'.
+        minimo (int): Valor mínimo.
+        maximo (int): Valor máximo.
+
+    Returns:
+        list[dict]: Lista de colegios filtrados, en el orden original.
+    """
+    global _indices_lista
+    if colegios is not _indices_lista:
+        # Primera consulta sobre esta lista: recorrido lineal
+        _indices_rango.clear()
+        _indices_lista = colegios
+        return [c for c in colegios if minimo <= c[campo] <= maximo]
+
+    if campo not in _indices_rango:
+        pares = sorted((c[campo], i) for i, c in enumerate(colegios))
+        _indices_rango[campo] = ([valor for valor, _ in pares], [i for _, i in pares])
+    valores, posiciones = _indices_rango[campo]
+
+    desde = bisect_left(valores, minimo)
+    hasta = bisect_right(valores, maximo)
+    return [colegios[i] for i in sorted(posiciones[desde:hasta])]
+
+
 def filtrar_por_rango_estudiantes(colegios: List[Dict], minimo: int, maximo: int) -> List[Dict]:
     """Filtra colegios por rango de cantidad de estudiantes.
 
@@ -114,10 +247,7 @@ def filtrar_por_rango_estudiantes(colegios: List[Dict], minimo: int, maximo: int
     if not colegios:
         return []
 
-    resultados = [
-        c for c in colegios
-        if minimo <= c.get("Cantidad de Estudiantes", 0) <= maximo
-    ]
+    resultados = _filtrar_rango(colegios, "Cantidad de Estudiantes", minimo, maximo)
 
     if resultados:
         print(f"\n✅ Colegios con {minimo:,} a {maximo:,} estudiantes: ({len(resultados)} encontrado(s))")
@@ -142,10 +272,7 @@ def filtrar_por_rango_año(colegios: List[Dict], minimo: int, maximo: int) -> Li
     if not colegios:
         return []
 
-    resultados = [
-        c for c in colegios
-        if minimo <= c.get("Año de Creación", 0) <= maximo
-    ]
+    resultados = _filtrar_rango(colegios, "Año de Creación", minimo, maximo)
 
     if resultados:
         print(f"\n✅ Colegios creados entre {minimo} y {maximo}: ({len(resultados)} encontrado(s))")
@@ -4,9 +4,52 @@ Este módulo proporciona funciones para agregar, editar y borrar colegios
 en el archivo CSV local.
 """
 
-from typing import List, Dict
-from funciones.vista import mostrar_colegios
-from funciones.utilidades import normalizar
+from typing import List, Dict, Optional
+from funciones.vista import invalidar_cache_orden, mostrar_colegios
+from funciones.utilidades import normalizar, preparar_colegio
+from funciones.busqueda import invalidar_cache_busqueda
+
+
+def _seleccionar_indice(colegios: List[Dict], nombre_buscar: str, accion: str) -> Optional[int]:
+    """Busca colegios por nombre y, si hay varios, pide al usuario que elija uno.
+
+    Args:
+        colegios (list[dict]): Lista actual de colegios.
+        nombre_buscar (str): Texto a buscar en el nombre.
+        accion (str): Verbo usado en el mensaje (ej.: 'editar', 'borrar').
+
+    Returns:
+        int | None: Índice del colegio elegido en `colegios`, o None si no hubo
+            coincidencias o la opción es inválida.
+    """
+    nombre_normalizado = normalizar(nombre_buscar)
+    indices_encontrados = [
+        i for i, c in enumerate(colegios)
+        if nombre_normalizado in c["_n_col"]
+    ]
+
+    if not indices_encontrados:
+        print(f"\n⚠️ No se encontró ningún colegio con el nombre '{nombre_buscar}'.")
+        return None
+
+    if len(indices_encontrados) == 1:
+        return indices_encontrados[0]
+
+    print(f"\n⚠️ Se encontraron {len(indices_encontrados)} colegios. Mostrando resultados:")
+    for i, idx in enumerate(indices_encontrados, 1):
+        print(f"{i}. {colegios[idx].get('Colegio')} ({colegios[idx].get('Provincia')})")
+
+    try:
+        opcion = int(input(f"\nIngrese el número del colegio a {accion}: ")) - 1
+    except ValueError:
+        print("⚠️ Debe ingresar un número.")
+        return None
+
+    if 0 <= opcion < len(indices_encontrados):
+        return indices_encontrados[opcion]
+
+    print("⚠️ Opción inválida.")
+    return None
 
 
 def agregar_colegio(colegios: List[Dict], ruta_csv: str) -> bool:
@@ -48,18 +91,20 @@ def agregar_colegio(colegios: List[Dict], ruta_csv: str) -> bool:
             print("⚠️ La cantidad de estudiantes y el año deben ser números enteros.")
             return False
 
-        nuevo_colegio = {
+        nuevo_colegio = preparar_colegio({
             "Provincia": provincia,
             "Colegio": colegio,
             "Cantidad de Estudiantes": cantidad_estudiantes,
             "Año de Creación": año_creacion
-        }
+        })
 
+        invalidar_cache_busqueda()
+        invalidar_cache_orden()
         colegios.append(nuevo_colegio)
 
-        # Guardar en CSV
-        from funciones.utilidades import escribir_csv
-        if escribir_csv(ruta_csv, colegios):
+        # Guardar en CSV (solo se agrega la fila nueva al final del archivo)
+        from funciones.utilidades import agregar_fila_csv
+        if agregar_fila_csv(ruta_csv, nuevo_colegio, colegios):
             print(f"\n✅ Colegio '{colegio}' agregado correctamente.")
             return True
         else:
@@ -97,36 +142,13 @@ def editar_colegio(colegios: List[Dict], ruta_csv: str) -> bool:
         print("⚠️ Debe ingresar un nombre.")
         return False
 
-    # Buscar colegio
-    nombre_normalizado = normalizar(nombre_buscar)
-    indices_encontrados = [
-        i for i, c in enumerate(colegios)
-        if nombre_normalizado in normalizar(c.get("Colegio", ""))
-    ]
-
-    if not indices_encontrados:
-        print(f"\n⚠️ No se encontró ningún colegio con el nombre '{nombre_buscar}'.")
+    idx_editar = _seleccionar_indice(colegios, nombre_buscar, "editar")
+    if idx_editar is None:
         return False
 
-    if len(indices_encontrados) > 1:
-        print(f"\n⚠️ Se encontraron {len(indices_encontrados)} colegios. Mostrando resultados:")
-        for i, idx in enumerate(indices_encontrados, 1):
-            print(f"{i}. {colegios[idx].get('Colegio')} ({colegios[idx].get('Provincia')})")
-        
-        try:
-            opcion = int(input("\nIngrese el número del colegio a editar: ")) - 1
-            if 0 <= opcion < len(indices_encontrados):
-                idx_editar = indices_encontrados[opcion]
-            else:
-                print("⚠️ Opción inválida.")
-                return False
-        except ValueError:
-            print("⚠️ Debe ingresar un número.")
-            return False
-    else:
-        idx_editar = indices_encontrados[0]
-
     colegio_original = colegios[idx_editar].copy()
+    invalidar_cache_busqueda()
+    invalidar_cache_orden()
     print(f"\n📋 Colegio a editar: {colegio_original.get('Colegio')}")
 
     try:
@@ -136,31 +158,41 @@ def editar_colegio(colegios: List[Dict], ruta_csv: str) -> bool:
         nueva_cantidad_str = input(f"Cantidad de Estudiantes [{colegio_original.get('Cantidad de Estudiantes')}]: ").strip()
         nuevo_año_str = input(f"Año de Creación [{colegio_original.get('Año de Creación')}]: ").strip()
 
-        # Aplicar cambios
-        if nueva_provincia:
-            colegios[idx_editar]["Provincia"] = nueva_provincia
-        if nuevo_colegio:
-            colegios[idx_editar]["Colegio"] = nuevo_colegio
+        # Validar campos numéricos antes de tocar el colegio, para que un
+        # error no deje la lista en memoria a medio modificar
+        cantidad = None
         if nueva_cantidad_str:
             try:
                 cantidad = int(nueva_cantidad_str)
-                if cantidad < 0:
-                    print("⚠️ La cantidad de estudiantes no puede ser negativa.")
-                    return False
-                colegios[idx_editar]["Cantidad de Estudiantes"] = cantidad
             except ValueError:
                 print("⚠️ La cantidad de estudiantes debe ser un número entero.")
                 return False
+            if cantidad < 0:
+                print("⚠️ La cantidad de estudiantes no puede ser negativa.")
+                return False
+        año = None
         if nuevo_año_str:
             try:
                 año = int(nuevo_año_str)
-                if año < 1800 or año > 2100:
-                    print("⚠️ El año de creación debe ser un valor razonable (1800-2100).")
-                    return False
-                colegios[idx_editar]["Año de Creación"] = año
             except ValueError:
                 print("⚠️ El año debe ser un número entero.")
                 return False
+            if año < 1800 or año > 2100:
+                print("⚠️ El año de creación debe ser un valor razonable (1800-2100).")
+                return False
+
+        # Aplicar cambios
+        if nueva_provincia:
+            colegios[idx_editar]["Provincia"] = nueva_provincia
+        if nuevo_colegio:
+            colegios[idx_editar]["Colegio"] = nuevo_colegio
+        if cantidad is not None:
+            colegios[idx_editar]["Cantidad de Estudiantes"] = cantidad
+        if año is not None:
+            colegios[idx_editar]["Año de Creación"] = año
+
+        # Actualizar claves normalizadas usadas por las búsquedas
+        preparar_colegio(colegios[idx_editar])
 
         # Guardar en CSV
         from funciones.utilidades import escribir_csv
@@ -204,35 +236,10 @@ def borrar_colegio(colegios: List[Dict], ruta_csv: str) -> bool:
         print("⚠️ Debe ingresar un nombre.")
         return False
 
-    # Buscar colegio
-    nombre_normalizado = normalizar(nombre_buscar)
-    indices_encontrados = [
-        i for i, c in enumerate(colegios)
-        if nombre_normalizado in normalizar(c.get("Colegio", ""))
-    ]
-
-    if not indices_encontrados:
-        print(f"\n⚠️ No se encontró ningún colegio con el nombre '{nombre_buscar}'.")
+    idx_borrar = _seleccionar_indice(colegios, nombre_buscar, "borrar")
+    if idx_borrar is None:
         return False
 
-    if len(indices_encontrados) > 1:
-        print(f"\n⚠️ Se encontraron {len(indices_encontrados)} colegios. Mostrando resultados:")
-        for i, idx in enumerate(indices_encontrados, 1):
-            print(f"{i}. {colegios[idx].get('Colegio')} ({colegios[idx].get('Provincia')})")
-        
-        try:
-            opcion = int(input("\nIngrese el número del colegio a borrar: ")) - 1
-            if 0 <= opcion < len(indices_encontrados):
-                idx_borrar = indices_encontrados[opcion]
-            else:
-                print("⚠️ Opción inválida.")
-                return False
-        except ValueError:
-            print("⚠️ Debe ingresar un número.")
-            return False
-    else:
-        idx_borrar = indices_encontrados[0]
-
     colegio_borrar = colegios[idx_borrar]
     print(f"\n⚠️ Está por borrar: {colegio_borrar.get('Colegio')} ({colegio_borrar.get('Provincia')})")
     confirmar = input("¿Está seguro? (s/n): ").strip().lower()
@@ -242,6 +249,8 @@ def borrar_colegio(colegios: List[Dict], ruta_csv: str) -> bool:
         return False
 
     try:
+        invalidar_cache_busqueda()
+        invalidar_cache_orden()
         colegios.pop(idx_borrar)
 
         # Guardar en CSV
@@ -4,20 +4,129 @@ Este módulo proporciona funciones para realizar peticiones HTTP a la API
 en http://149.50.150.15:8020.
 """
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
-from typing import List, Dict, Optional
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson es opcional: sin él se usa el decodificador estándar de requests
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson es opcional: sin él `iterar_colegios` decodifica la lista completa
+    ijson = None
 
 
 BASE_URL = "http://149.50.150.15:8020"
 
+# Sesión compartida por todas las peticiones: reutiliza las conexiones TCP
+# (keep-alive) en lugar de abrir una nueva en cada llamada.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Las lecturas (GET) usan urllib3 directamente, que evita la capa extra de
+# requests (hooks, cookies, detección de codificación). Con False se usa la
+# sesión de requests también para las lecturas. A diferencia de requests,
+# urllib3 no pide respuestas comprimidas por defecto: se agrega
+# `Accept-Encoding` y urllib3 las descomprime al leerlas.
+USAR_URLLIB3 = True
+_pool = urllib3.PoolManager(
+    num_pools=2,
+    maxsize=16,
+    retries=Retry(total=2, backoff_factor=0.2),
+    headers=urllib3.make_headers(accept_encoding=True),
+)
+
+# Hilos para lecturas en paralelo; no debe superar `maxsize` de `_pool`, que
+# es el que hace los GET.
+_MAX_WORKERS = 8
+
+# Las lecturas (GET) de datos se cachean durante `_CACHE_TTL` segundos; la
+# verificación de `/health` no. Cualquier escritura o cambio de servidor
+# incrementa `_cache_epoch`, que forma parte de la clave, y así invalida todas
+# las entradas anteriores.
+_CACHE_TTL = 30
+_cache_epoch = 0
+
+# Si el servidor acepta `?fields=` en `/colegios`; se desactiva al primer rechazo
+_FIELDS_EN_SERVIDOR = True
+# Códigos con los que el servidor rechaza un parámetro que no conoce
+_RECHAZO_PARAMETRO = frozenset({400, 422})
+
+
+def _invalidar_cache() -> None:
+    """Invalida las lecturas cacheadas (se llama después de cada escritura)."""
+    global _cache_epoch
+    _cache_epoch += 1
+
+
+def _ventana_ttl() -> int:
+    """Devuelve el número de ventana de tiempo actual para expirar el caché."""
+    return int(time.monotonic() // _CACHE_TTL)
+
+
+def vigencia_cache() -> Tuple[int, int]:
+    """Devuelve la clave de vigencia de las lecturas cacheadas.
+
+    Cambia cuando se hace una escritura, se cambia de servidor o vence la
+    ventana de `_CACHE_TTL` segundos. Sirve para que otros módulos cacheen
+    datos derivados de las lecturas con la misma regla de expiración.
+
+    Returns:
+        tuple[int, int]: (época de escrituras, ventana de tiempo).
+    """
+    return _cache_epoch, _ventana_ttl()
+
+
 def establecer_base_url(url: str) -> None:
     """Permite cambiar la URL base del servidor (útil para pruebas).
     
     Args:
         url (str): Nueva URL base del servidor.
     """
-    global BASE_URL
+    global BASE_URL, _FIELDS_EN_SERVIDOR
     BASE_URL = (url or "").rstrip("/")
+    _FIELDS_EN_SERVIDOR = True
+    _invalidar_cache()
+
+
+def cerrar_sesion() -> None:
+    """Cierra la sesión HTTP compartida y libera sus conexiones."""
+    _session.close()
+    _pool.clear()
+
+
+def _json(resp: requests.Response):
+    """Decodifica el cuerpo JSON de una respuesta.
+
+    Usa `orjson` (implementado en C) si está instalado; si no, `resp.json()`.
+
+    Args:
+        resp (requests.Response): Respuesta HTTP.
+
+    Returns:
+        Any: Contenido decodificado.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
 
 
 def _url(endpoint: str) -> str:
@@ -32,9 +141,79 @@ def _url(endpoint: str) -> str:
     return f"{BASE_URL}{endpoint}"
 
 
+def _error_http(status: int, url: str) -> requests.HTTPError:
+    """Arma el `HTTPError` de una respuesta de urllib3 con su código de estado.
+
+    Se adjunta una `requests.Response` mínima, así `codigo_estado` (y
+    `e.response.status_code`) funciona igual que con las peticiones hechas
+    con `requests`.
+
+    Args:
+        status (int): Código de estado HTTP.
+        url (str): URL pedida.
+
+    Returns:
+        requests.HTTPError: Error listo para lanzar.
+    """
+    respuesta = requests.Response()
+    respuesta.status_code = status
+    respuesta.url = url
+    return requests.HTTPError(f"{status} Error para la URL: {url}", response=respuesta)
+
+
+def codigo_estado(error: requests.HTTPError) -> Optional[int]:
+    """Devuelve el código de estado HTTP de un error de la API.
+
+    Args:
+        error (requests.HTTPError): Error lanzado por alguna función de este módulo.
+
+    Returns:
+        int | None: Código de estado, o None si el error no trae la respuesta.
+    """
+    respuesta = getattr(error, "response", None)
+    return respuesta.status_code if respuesta is not None else None
+
+
+def _get(endpoint: str, params: Optional[Dict[str, str]] = None):
+    """Realiza un GET y devuelve el JSON decodificado.
+
+    Los errores se traducen a las excepciones de `requests` para que los
+    llamadores no dependan de qué biblioteca hizo la petición.
+
+    Args:
+        endpoint (str): Ruta del endpoint (ej: '/colegios').
+        params (dict | None): Parámetros de la URL.
+
+    Returns:
+        Any: Contenido decodificado.
+
+    Raises:
+        requests.HTTPError: Si la respuesta no es correcta.
+        requests.ConnectionError: Si no se puede conectar al servidor.
+    """
+    url = _url(endpoint)
+    if not USAR_URLLIB3:
+        resp = _session.get(url, params=params, timeout=10)
+        resp.raise_for_status()
+        return _json(resp)
+
+    try:
+        resp = _pool.request("GET", url, fields=params, timeout=10.0)
+    except urllib3.exceptions.HTTPError as e:
+        raise requests.ConnectionError(e) from e
+    if resp.status >= 400:
+        raise _error_http(resp.status, url)
+    if orjson is not None:
+        return orjson.loads(resp.data)
+    return json.loads(resp.data)
+
+
 def estado_servidor() -> Dict:
     """Verifica el estado del servidor.
 
+    No pasa por el caché de lecturas: se usa para comprobar la conexión y
+    debe reflejar el estado actual del servidor.
+
     Returns:
         dict: Diccionario con el estado del servidor.
 
@@ -43,9 +222,7 @@ def estado_servidor() -> Dict:
         requests.ConnectionError: Si no se puede conectar al servidor.
     """
     try:
-        resp = requests.get(_url("/health"), timeout=10)
-        resp.raise_for_status()
-        return resp.json()
+        return _get("/health")
     except requests.ConnectionError as e:
         raise requests.ConnectionError(
             f"No se pudo conectar al servidor en {BASE_URL}. "
@@ -54,19 +231,89 @@ def estado_servidor() -> Dict:
         ) from e
 
 
+def _parametros_listado(
+    q: Optional[str],
+    provincia: Optional[str],
+    ordenar_por: Optional[str],
+    descendente: bool,
+    min_estudiantes: Optional[int],
+    max_estudiantes: Optional[int],
+    min_año: Optional[int],
+    max_año: Optional[int],
+    limite: Optional[int] = None,
+    desplazamiento: Optional[int] = None,
+) -> Dict[str, str]:
+    """Arma los parámetros de la URL de `GET /colegios` (ver `listar_colegios`)."""
+    params: Dict[str, str] = {}
+    if q:
+        params["q"] = q
+    if provincia:
+        params["Provincia"] = provincia
+    if ordenar_por:
+        params["sort_by"] = ordenar_por
+    if descendente:
+        params["desc"] = "true"
+    if min_estudiantes is not None:
+        params["min_estudiantes"] = str(min_estudiantes)
+    if max_estudiantes is not None:
+        params["max_estudiantes"] = str(max_estudiantes)
+    if min_año is not None:
+        params["min_año"] = str(min_año)
+    if max_año is not None:
+        params["max_año"] = str(max_año)
+    if limite is not None:
+        params["limit"] = str(limite)
+    if desplazamiento:
+        params["offset"] = str(desplazamiento)
+    return params
+
+
+@lru_cache(maxsize=64)
+def _listar_cacheado(params: Tuple[Tuple[str, str], ...], epoch: int, ventana: int) -> List[Dict]:
+    """Consulta `/colegios`; `epoch` y `ventana` solo forman la clave del caché."""
+    return _get("/colegios", dict(params))
+
+
 def listar_colegios(
     q: Optional[str] = None,
     provincia: Optional[str] = None,
     ordenar_por: Optional[str] = None,
     descendente: bool = False,
+    min_estudiantes: Optional[int] = None,
+    max_estudiantes: Optional[int] = None,
+    min_año: Optional[int] = None,
+    max_año: Optional[int] = None,
+    campos: Optional[Sequence[str]] = None,
+    limite: Optional[int] = None,
+    desplazamiento: Optional[int] = None,
 ) -> List[Dict]:
     """Lista colegios con filtros y orden opcional.
 
+    Los rangos se envían como parámetros de la URL para que el servidor devuelva
+    solo las filas que coinciden. Si el servidor los ignora, la respuesta trae
+    todos los colegios y el filtrado local sigue dando el resultado correcto.
+
+    Con `campos`, se pide al servidor solo esas columnas (`?fields=...`). Si el
+    servidor ignora el parámetro llegan las filas completas; si lo rechaza
+    (400 o 422), se repite la consulta sin él y no se vuelve a enviar en esta
+    sesión.
+
+    `limite` y `desplazamiento` piden una sola página del resultado ya ordenado
+    (`?limit=...&offset=...`). Un servidor que no pagina devuelve todo.
+
     Args:
         q (str | None): Texto para buscar por colegio o provincia.
         provincia (str | None): Filtro por provincia.
         ordenar_por (str | None): Campo de orden (ej.: 'Provincia', 'Colegio', 'Cantidad de Estudiantes', 'Año de Creación').
         descendente (bool): Si True, orden descendente.
+        min_estudiantes (int | None): Cantidad mínima de estudiantes.
+        max_estudiantes (int | None): Cantidad máxima de estudiantes.
+        min_año (int | None): Año de creación mínimo.
+        max_año (int | None): Año de creación máximo.
+        campos (Sequence[str] | None): Columnas a pedir (ej.: `['Colegio', 'Provincia', 'id']`).
+            Por defecto, todas.
+        limite (int | None): Cantidad máxima de colegios a devolver.
+        desplazamiento (int | None): Cantidad de colegios a saltear.
 
     Returns:
         list[dict]: Lista de colegios con estructura: Provincia, Colegio, Cantidad de Estudiantes, Año de Creación.
@@ -74,19 +321,137 @@ def listar_colegios(
     Raises:
         requests.HTTPError: Si la respuesta no es correcta.
     """
-    params: Dict[str, str] = {}
-    if q:
-        params["q"] = q
-    if provincia:
-        params["Provincia"] = provincia
-    if ordenar_por:
-        params["sort_by"] = ordenar_por
-    if descendente:
-        params["desc"] = "true"
+    global _FIELDS_EN_SERVIDOR
+    params = _parametros_listado(
+        q, provincia, ordenar_por, descendente, min_estudiantes, max_estudiantes, min_año, max_año,
+        limite, desplazamiento,
+    )
+    if campos and _FIELDS_EN_SERVIDOR:
+        try:
+            proyectados = dict(params, fields=",".join(campos))
+            return list(_listar_cacheado(tuple(sorted(proyectados.items())), _cache_epoch, _ventana_ttl()))
+        except requests.HTTPError as e:
+            # Otros errores (ej.: 5xx) no dicen nada sobre `fields`
+            if codigo_estado(e) not in _RECHAZO_PARAMETRO:
+                raise
+            # El servidor no acepta `fields`: se piden las filas completas y
+            # no se vuelve a enviar en esta sesión
+            _FIELDS_EN_SERVIDOR = False
+    return list(_listar_cacheado(tuple(sorted(params.items())), _cache_epoch, _ventana_ttl()))
+
+
+def _abrir_listado(params: Dict[str, str]) -> urllib3.HTTPResponse:
+    """Abre `GET /colegios` sin leer el cuerpo (para `iterar_colegios`).
+
+    Raises:
+        requests.HTTPError: Si la respuesta no es correcta.
+        requests.ConnectionError: Si no se puede conectar al servidor.
+    """
+    url = _url("/colegios")
+    try:
+        resp = _pool.request("GET", url, fields=params, timeout=10.0, preload_content=False)
+    except urllib3.exceptions.HTTPError as e:
+        raise requests.ConnectionError(e) from e
+    if resp.status >= 400:
+        resp.release_conn()
+        raise _error_http(resp.status, url)
+    return resp
+
+
+def iterar_colegios(
+    q: Optional[str] = None,
+    provincia: Optional[str] = None,
+    ordenar_por: Optional[str] = None,
+    descendente: bool = False,
+    min_estudiantes: Optional[int] = None,
+    max_estudiantes: Optional[int] = None,
+    min_año: Optional[int] = None,
+    max_año: Optional[int] = None,
+    campos: Optional[Sequence[str]] = None,
+) -> Iterator[Dict]:
+    """Recorre los colegios de `GET /colegios` a medida que llegan.
+
+    Con `ijson` instalado, la respuesta se decodifica en streaming y nunca se
+    tiene en memoria la lista completa; sirve para quien la recorre una sola
+    vez. Sin `ijson` (o con `USAR_URLLIB3 = False`) recorre `listar_colegios`.
+    Estas lecturas no pasan por el caché. `campos` funciona igual que en
+    `listar_colegios`.
+
+    Args:
+        q (str | None): Texto para buscar por colegio o provincia.
+        provincia (str | None): Filtro por provincia.
+        ordenar_por (str | None): Campo de orden.
+        descendente (bool): Si True, orden descendente.
+        min_estudiantes (int | None): Cantidad mínima de estudiantes.
+        max_estudiantes (int | None): Cantidad máxima de estudiantes.
+        min_año (int | None): Año de creación mínimo.
+        max_año (int | None): Año de creación máximo.
+        campos (Sequence[str] | None): Columnas a pedir. Por defecto, todas.
+
+    Yields:
+        dict: Un colegio por vez.
+
+    Raises:
+        requests.HTTPError: Si la respuesta no es correcta.
+        requests.ConnectionError: Si no se puede conectar al servidor.
+    """
+    global _FIELDS_EN_SERVIDOR
+    if ijson is None or not USAR_URLLIB3:
+        yield from listar_colegios(
+            q, provincia, ordenar_por, descendente, min_estudiantes, max_estudiantes, min_año, max_año,
+            campos=campos,
+        )
+        return
+
+    params = _parametros_listado(
+        q, provincia, ordenar_por, descendente, min_estudiantes, max_estudiantes, min_año, max_año
+    )
+    resp = None
+    if campos and _FIELDS_EN_SERVIDOR:
+        try:
+            resp = _abrir_listado(dict(params, fields=",".join(campos)))
+        except requests.HTTPError as e:
+            # Otros errores (ej.: 5xx) no dicen nada sobre `fields`
+            if codigo_estado(e) not in _RECHAZO_PARAMETRO:
+                raise
+            # El servidor no acepta `fields`: se piden las filas completas y
+            # no se vuelve a enviar en esta sesión
+            _FIELDS_EN_SERVIDOR = False
+    if resp is None:
+        resp = _abrir_listado(params)
+    try:
+        yield from ijson.items(resp, "item")
+    finally:
+        resp.release_conn()
+
+
+@lru_cache(maxsize=4)
+def _estadisticas_cacheado(epoch: int, ventana: int) -> Dict:
+    """Consulta `/colegios/stats`; `epoch` y `ventana` solo forman la clave del caché."""
+    return _get("/colegios/stats")
+
+
+def obtener_estadisticas() -> Dict:
+    """Obtiene las estadísticas generales calculadas por el servidor.
+
+    El servidor devuelve solo los agregados (extremos, totales, promedios y
+    conteo por provincia), sin transferir la lista completa de colegios.
+
+    Returns:
+        dict: Estadísticas con las mismas claves que
+            `estadisticas.calcular_estadisticas`.
+
+    Raises:
+        requests.HTTPError: Si la respuesta no es correcta (por ejemplo, si el
+            servidor no tiene este endpoint).
+    """
+    return dict(_estadisticas_cacheado(_cache_epoch, _ventana_ttl()))
 
-    resp = requests.get(_url("/colegios"), params=params, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+
+@lru_cache(maxsize=64)
+def _obtener_cacheado(id_colegio: int, epoch: int, ventana: int) -> Dict:
+    """Consulta `/colegios/{id}`; `epoch` y `ventana` solo forman la clave del caché."""
+    return _get(f"/colegios/{id_colegio}")
 
 
 def obtener_colegio(id_colegio: int) -> Dict:
@@ -101,9 +466,30 @@ def obtener_colegio(id_colegio: int) -> Dict:
     Raises:
         requests.HTTPError: Si la respuesta no es correcta.
     """
-    resp = requests.get(_url(f"/colegios/{id_colegio}"), timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    return dict(_obtener_cacheado(id_colegio, _cache_epoch, _ventana_ttl()))
+
+
+def obtener_colegios(ids_colegios: List[int]) -> List[Dict]:
+    """Obtiene varios colegios por ID con peticiones en paralelo.
+
+    Cada hilo toma una conexión de `_pool` (o de la sesión, con
+    `USAR_URLLIB3 = False`), así que el tiempo total se acerca al de una sola
+    petición en lugar de sumar una por cada ID. Cada lectura pasa por el caché
+    de `obtener_colegio`.
+
+    Args:
+        ids_colegios (list[int]): IDs de los colegios.
+
+    Returns:
+        list[dict]: Datos de los colegios, en el mismo orden que los IDs.
+
+    Raises:
+        requests.HTTPError: Si alguna respuesta no es correcta.
+    """
+    if not ids_colegios:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(ids_colegios))) as ejecutor:
+        return list(ejecutor.map(obtener_colegio, ids_colegios))
 
 
 def crear_colegio(
@@ -132,9 +518,10 @@ def crear_colegio(
         "Cantidad de Estudiantes": cantidad_estudiantes,
         "Año de Creación": año_creacion,
     }
-    resp = requests.post(_url("/colegios"), json=payload, timeout=10)
+    resp = _session.post(_url("/colegios"), json=payload, timeout=10)
+    _invalidar_cache()
     resp.raise_for_status()
-    return resp.json()
+    return _json(resp)
 
 
 def actualizar_colegio_parcial(id_colegio: int, cambios: Dict) -> Dict:
@@ -150,9 +537,10 @@ def actualizar_colegio_parcial(id_colegio: int, cambios: Dict) -> Dict:
     Raises:
         requests.HTTPError: Si la respuesta no es correcta.
     """
-    resp = requests.patch(_url(f"/colegios/{id_colegio}"), json=cambios, timeout=10)
+    resp = _session.patch(_url(f"/colegios/{id_colegio}"), json=cambios, timeout=10)
+    _invalidar_cache()
     resp.raise_for_status()
-    return resp.json()
+    return _json(resp)
 
 
 def eliminar_colegio(id_colegio: int) -> bool:
@@ -167,6 +555,7 @@ def eliminar_colegio(id_colegio: int) -> bool:
     Raises:
         requests.HTTPError: Si la respuesta no es correcta.
     """
-    resp = requests.delete(_url(f"/colegios/{id_colegio}"), timeout=10)
+    resp = _session.delete(_url(f"/colegios/{id_colegio}"), timeout=10)
+    _invalidar_cache()
     resp.raise_for_status()
     return True
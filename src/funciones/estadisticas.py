@@ -1,17 +1,25 @@
 """Cálculo e impresión de estadísticas sobre una lista de colegios."""
 
-from typing import List, Dict
+from collections import Counter
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
 from funciones.utilidades import normalizar
 
 
+# Extrae los tres campos de una fila en una sola llamada en C
+_CAMPOS_ESTADISTICAS = itemgetter("Provincia", "Año de Creación", "Cantidad de Estudiantes")
+
+
 def contar_colegios_por_provincia_recursivo(colegios: List[Dict], indice: int = 0, conteo: Dict[str, int] = None) -> Dict[str, int]:
-    """Cuenta colegios por provincia de forma recursiva.
+    """Cuenta colegios por provincia.
 
-    Implementación recursiva para cumplir con los requisitos del proyecto.
+    Conserva el nombre y la firma de la versión recursiva original, pero
+    recorre la lista con un `Counter`, sin límite de profundidad de pila.
 
     Args:
         colegios (list[dict]): Lista de colegios.
-        indice (int): Índice actual en la lista (para recursión).
+        indice (int): Índice desde el cual empezar a contar.
         conteo (dict): Diccionario acumulativo de conteos.
 
     Returns:
@@ -20,74 +28,122 @@ def contar_colegios_por_provincia_recursivo(colegios: List[Dict], indice: int =
     if conteo is None:
         conteo = {}
 
-    # Caso base: se recorrió toda la lista
-    if indice >= len(colegios):
-        return conteo
+    parciales = Counter(c.get("Provincia", "Desconocida") for c in islice(colegios, indice, None))
+    for provincia, cantidad in parciales.items():
+        conteo[provincia] = conteo.get(provincia, 0) + cantidad
 
-    # Procesar el elemento actual
-    colegio_actual = colegios[indice]
-    provincia = colegio_actual.get("Provincia", "Desconocida")
-    conteo[provincia] = conteo.get(provincia, 0) + 1
-
-    # Llamada recursiva para el siguiente elemento
-    return contar_colegios_por_provincia_recursivo(colegios, indice + 1, conteo)
+    return conteo
 
 
 def sumar_estudiantes_recursivo(colegios: List[Dict], indice: int = 0) -> int:
-    """Suma la cantidad de estudiantes de forma recursiva.
+    """Suma la cantidad de estudiantes.
 
-    Implementación recursiva para cumplir con los requisitos del proyecto.
+    Conserva el nombre y la firma de la versión recursiva original, pero
+    recorre la lista en un solo `sum`, sin límite de profundidad de pila.
 
     Args:
         colegios (list[dict]): Lista de colegios.
-        indice (int): Índice actual en la lista (para recursión).
+        indice (int): Índice desde el cual empezar a sumar.
 
     Returns:
         int: Total de estudiantes.
     """
-    # Caso base: se recorrió toda la lista
-    if indice >= len(colegios):
-        return 0
-
-    # Procesar el elemento actual
-    estudiantes_actual = colegios[indice].get("Cantidad de Estudiantes", 0)
+    return sum(c.get("Cantidad de Estudiantes", 0) for c in islice(colegios, indice, None))
 
-    # Llamada recursiva para el siguiente elemento y sumar
-    return estudiantes_actual + sumar_estudiantes_recursivo(colegios, indice + 1)
 
+def calcular_estadisticas(colegios: Iterable[Dict]) -> Optional[Dict]:
+    """Calcula las estadísticas generales de los colegios en una sola pasada.
 
-def mostrar_estadisticas(colegios: List[Dict]) -> None:
-    """Imprime estadísticas generales de una lista de colegios.
+    Acepta cualquier iterable, así los colegios pueden llegar de a uno (por
+    ejemplo, de `cliente_api.iterar_colegios`) sin armar la lista completa.
 
     Args:
-        colegios (list[dict]): Lista de colegios. Cada colegio debe contener:
-            - 'Provincia' (str)
-            - 'Colegio' (str)
-            - 'Cantidad de Estudiantes' (int)
-            - 'Año de Creación' (int)
-    """
-    if not colegios:
-        print("\n⚠️ No hay datos disponibles para mostrar estadísticas.")
-        return
-
-    # Colegio más antiguo y más nuevo
-    colegio_mas_antiguo = min(colegios, key=lambda x: x.get("Año de Creación", 9999))
-    colegio_mas_nuevo = max(colegios, key=lambda x: x.get("Año de Creación", 0))
+        colegios (iterable[dict]): Colegios (lista, generador, etc.).
 
-    # Promedio de año de creación
-    años = [c.get("Año de Creación", 0) for c in colegios if c.get("Año de Creación", 0) > 0]
-    promedio_año = sum(años) / len(años) if años else 0
-
-    # Total de estudiantes (usando función recursiva)
-    total_estudiantes = sumar_estudiantes_recursivo(colegios)
-    promedio_estudiantes = total_estudiantes / len(colegios) if colegios else 0
-
-    # Colegios con más y menos estudiantes
-    colegio_mas_estudiantes = max(colegios, key=lambda x: x.get("Cantidad de Estudiantes", 0))
-    colegio_menos_estudiantes = min(colegios, key=lambda x: x.get("Cantidad de Estudiantes", 999999))
+    Returns:
+        dict | None: Estadísticas con las claves 'colegio_mas_antiguo', 'colegio_mas_nuevo',
+            'promedio_año', 'total_estudiantes', 'promedio_estudiantes',
+            'colegio_mas_estudiantes', 'colegio_menos_estudiantes' y
+            'colegios_por_provincia', o None si no hay colegios. Los 'colegio_*'
+            son filas con al menos 'Colegio', 'Cantidad de Estudiantes' y
+            'Año de Creación'.
+    """
+    # Una sola pasada: extremos, sumas y conteo por provincia a la vez.
+    # Las comparaciones estrictas conservan el primer colegio en caso de empate,
+    # igual que min()/max().
+    filas = iter(colegios)
+    primero = next(filas, None)
+    if primero is None:
+        return None
+    colegio_mas_antiguo = colegio_mas_nuevo = primero
+    colegio_mas_estudiantes = colegio_menos_estudiantes = primero
+    min_año = primero.get("Año de Creación", 9999)
+    max_año = primero.get("Año de Creación", 0)
+    max_est = primero.get("Cantidad de Estudiantes", 0)
+    min_est = primero.get("Cantidad de Estudiantes", 999999)
+    suma_años = cantidad_años = total_estudiantes = cantidad = 0
+    colegios_por_provincia = Counter()
+
+    for cantidad, colegio in enumerate(chain((primero,), filas), 1):
+        try:
+            provincia, año, estudiantes = _CAMPOS_ESTADISTICAS(colegio)
+        except KeyError:
+            # Fila sin todos los campos (no pasó por preparar_colegio)
+            obtener = colegio.get
+            provincia = obtener("Provincia", "Desconocida")
+            año = obtener("Año de Creación")
+            estudiantes = obtener("Cantidad de Estudiantes")
+
+        año_min = 9999 if año is None else año
+        año_max = 0 if año is None else año
+        if año_min < min_año:
+            min_año, colegio_mas_antiguo = año_min, colegio
+        if año_max > max_año:
+            max_año, colegio_mas_nuevo = año_max, colegio
+        if año_max > 0:
+            suma_años += año_max
+            cantidad_años += 1
+
+        est_max = 0 if estudiantes is None else estudiantes
+        est_min = 999999 if estudiantes is None else estudiantes
+        total_estudiantes += est_max
+        if est_max > max_est:
+            max_est, colegio_mas_estudiantes = est_max, colegio
+        if est_min < min_est:
+            min_est, colegio_menos_estudiantes = est_min, colegio
+
+        colegios_por_provincia[provincia] += 1
+
+    promedio_año = suma_años / cantidad_años if cantidad_años else 0
+    promedio_estudiantes = total_estudiantes / cantidad
+
+    return {
+        "colegio_mas_antiguo": colegio_mas_antiguo,
+        "colegio_mas_nuevo": colegio_mas_nuevo,
+        "promedio_año": promedio_año,
+        "total_estudiantes": total_estudiantes,
+        "promedio_estudiantes": promedio_estudiantes,
+        "colegio_mas_estudiantes": colegio_mas_estudiantes,
+        "colegio_menos_estudiantes": colegio_menos_estudiantes,
+        "colegios_por_provincia": dict(colegios_por_provincia),
+    }
+
+
+def imprimir_estadisticas(estadisticas: Dict) -> None:
+    """Imprime estadísticas ya calculadas (ver `calcular_estadisticas`).
 
-    # Conteo por provincia (usando función recursiva)
-    colegios_por_provincia = contar_colegios_por_provincia_recursivo(colegios)
+    Args:
+        estadisticas (dict): Estadísticas con las claves de `calcular_estadisticas`,
+            ya sea calculadas localmente o devueltas por la API.
+    """
+    colegio_mas_antiguo = estadisticas["colegio_mas_antiguo"]
+    colegio_mas_nuevo = estadisticas["colegio_mas_nuevo"]
+    promedio_año = estadisticas["promedio_año"]
+    total_estudiantes = estadisticas["total_estudiantes"]
+    promedio_estudiantes = estadisticas["promedio_estudiantes"]
+    colegio_mas_estudiantes = estadisticas["colegio_mas_estudiantes"]
+    colegio_menos_estudiantes = estadisticas["colegio_menos_estudiantes"]
+    colegios_por_provincia = estadisticas["colegios_por_provincia"]
 
     print("\n" + "=" * 60)
     print("📊 ESTADÍSTICAS GENERALES")
@@ -105,3 +161,22 @@ def mostrar_estadisticas(colegios: List[Dict]) -> None:
     for provincia, cantidad in sorted(colegios_por_provincia.items()):
         print(f"      - {provincia}: {cantidad}")
     print("=" * 60)
+
+
+def mostrar_estadisticas(colegios: Iterable[Dict]) -> None:
+    """Imprime estadísticas generales de los colegios.
+
+    Args:
+        colegios (iterable[dict]): Lista (o cualquier iterable) de colegios.
+            Cada colegio debe contener:
+            - 'Provincia' (str)
+            - 'Colegio' (str)
+            - 'Cantidad de Estudiantes' (int)
+            - 'Año de Creación' (int)
+    """
+    estadisticas = calcular_estadisticas(colegios)
+    if estadisticas is None:
+        print("\n⚠️ No hay datos disponibles para mostrar estadísticas.")
+        return
+
+    imprimir_estadisticas(estadisticas)
@@ -9,6 +9,56 @@ import shutil
 import csv
 from funciones.utilidades import limpiar_consola
 
+# Directorios que no se recorren al buscar un CSV fuera de lugar
+_DIRECTORIOS_IGNORADOS = frozenset({'__pycache__', 'venv', '.venv', 'node_modules'})
+
+
+def _ubicaciones_conocidas(directorio_base: str) -> list[str]:
+    """Devuelve las rutas donde suele quedar un `colegios.csv` fuera de lugar.
+
+    Args:
+        directorio_base (str): Directorio raíz del proyecto.
+
+    Returns:
+        list[str]: Rutas candidatas, en orden de preferencia.
+    """
+    return [
+        os.path.join(directorio_base, 'colegios.csv'),
+        os.path.join(directorio_base, 'data', 'colegios.csv'),
+        os.path.join(directorio_base, 'src', 'colegios.csv'),
+        os.path.join(directorio_base, 'base_de_datos', 'colegios.csv'),
+    ]
+
+
+def _buscar_csv(directorio_base: str, ruta_excluida: str) -> str | None:
+    """Busca un `colegios.csv` recorriendo el proyecto con `os.scandir`.
+
+    Los `DirEntry` de `scandir` ya traen el tipo de entrada, así que no hace
+    falta un `stat` extra por archivo como con `os.walk`.
+
+    Args:
+        directorio_base (str): Directorio desde donde buscar.
+        ruta_excluida (str): Ruta normalizada que no cuenta como hallazgo.
+
+    Returns:
+        str | None: Ruta del primer `colegios.csv` encontrado, o None.
+    """
+    pendientes = [directorio_base]
+    while pendientes:
+        try:
+            entradas = os.scandir(pendientes.pop())
+        except OSError:
+            continue
+        with entradas:
+            for entrada in entradas:
+                if entrada.is_dir(follow_symlinks=False):
+                    # Evitar buscar en .git, __pycache__, etc.
+                    if not entrada.name.startswith('.') and entrada.name not in _DIRECTORIOS_IGNORADOS:
+                        pendientes.append(entrada.path)
+                elif entrada.name == 'colegios.csv' and os.path.normpath(entrada.path) != ruta_excluida:
+                    return entrada.path
+    return None
+
 
 def gestionar_db(directorio_base: str, ruta_objetivo: str) -> str | None:
     """Verifica, busca, mueve o crea el archivo `colegios.csv`.
@@ -26,20 +76,17 @@ def gestionar_db(directorio_base: str, ruta_objetivo: str) -> str | None:
     if os.path.isfile(ruta_objetivo_norm):
         return ruta_objetivo_norm
 
-    # Buscar en todo el proyecto
+    # Probar primero las ubicaciones habituales, sin recorrer el proyecto
     archivo_encontrado = None
-    for root, dirs, files in os.walk(directorio_base):
-        # Evitar buscar en .git, __pycache__, etc.
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'venv', '.venv']]
-        
-        if 'colegios.csv' in files:
-            candidato = os.path.join(root, 'colegios.csv')
-            # Si está en la ubicación objetivo, ya lo retornamos arriba
-            if os.path.normpath(candidato) == ruta_objetivo_norm:
-                continue
+    for candidato in _ubicaciones_conocidas(directorio_base):
+        if os.path.normpath(candidato) != ruta_objetivo_norm and os.path.isfile(candidato):
             archivo_encontrado = candidato
             break
 
+    # Solo si no está en ninguna, buscar en todo el proyecto
+    if archivo_encontrado is None:
+        archivo_encontrado = _buscar_csv(directorio_base, ruta_objetivo_norm)
+
     # Si se encontró, moverlo
     if archivo_encontrado:
         try:
@@ -70,13 +117,51 @@ def gestionar_db(directorio_base: str, ruta_objetivo: str) -> str | None:
         return None
 
 
-def init_db(project_root: str) -> str | None:
+def sincronizar_subgrupos(db_path: str, colegios: list[dict] | None = None) -> None:
+    """Sincroniza la estructura jerárquica de subgrupos con el CSV central.
+
+    Si el llamador ya leyó los colegios, se clasifican desde esa lista y el
+    CSV no se vuelve a recorrer; si no, se lee fila a fila.
+
+    Args:
+        db_path (str): Ruta del archivo CSV central.
+        colegios (list[dict] | None): Colegios ya leídos de `db_path`, o None.
+    """
+    try:
+        from funciones.jerarquia import (
+            inicializar_estructura_jerarquica,
+            sincronizar_desde_archivo,
+            sincronizar_estructura_jerarquica,
+        )
+
+        # Inicializar carpetas
+        inicializar_estructura_jerarquica(db_path)
+
+        if colegios is None:
+            # Sincronizar datos existentes leyendo el CSV fila a fila
+            sincronizado = sincronizar_desde_archivo(db_path)
+        else:
+            sincronizado = sincronizar_estructura_jerarquica(colegios, db_path)
+        if sincronizado:
+            print("✅ Estructura jerárquica inicializada")
+    except ImportError:
+        # Si el módulo jerarquia no está disponible, continuar sin estructura jerárquica
+        pass
+    except Exception as e:
+        # Si hay algún error, continuar sin estructura jerárquica
+        print(f"⚠️  No se pudo inicializar estructura jerárquica: {e}")
+
+
+def init_db(project_root: str, sincronizar: bool = True) -> str | None:
     """Inicializa la base de datos de colegios.
 
     También inicializa la estructura jerárquica de subgrupos si existe el módulo.
 
     Args:
         project_root (str): Ruta raíz del proyecto.
+        sincronizar (bool): Si es False, no sincroniza los subgrupos; el
+            llamador lo hace después con `sincronizar_subgrupos`, pasando los
+            colegios que ya leyó.
 
     Returns:
         str | None: Ruta del archivo CSV o None si hay error.
@@ -88,24 +173,7 @@ def init_db(project_root: str) -> str | None:
         return None
 
     # Inicializar estructura jerárquica si el archivo existe
-    if db_path and os.path.exists(db_path):
-        try:
-            from funciones.jerarquia import inicializar_estructura_jerarquica, sincronizar_estructura_jerarquica
-            from funciones.utilidades import leer_csv
-
-            # Inicializar carpetas
-            inicializar_estructura_jerarquica(db_path)
-
-            # Sincronizar datos existentes
-            colegios = leer_csv(db_path)
-            if colegios:
-                sincronizar_estructura_jerarquica(colegios, db_path)
-                print("✅ Estructura jerárquica inicializada")
-        except ImportError:
-            # Si el módulo jerarquia no está disponible, continuar sin estructura jerárquica
-            pass
-        except Exception as e:
-            # Si hay algún error, continuar sin estructura jerárquica
-            print(f"⚠️  No se pudo inicializar estructura jerárquica: {e}")
+    if sincronizar and os.path.exists(db_path):
+        sincronizar_subgrupos(db_path)
 
     return db_path
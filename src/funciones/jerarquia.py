@@ -13,9 +13,41 @@ del proyecto de tener una estructura de base de datos separada jerárquicamente.
 
 import os
 import csv
+import hashlib
+import json
+import mmap
 import shutil
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterable, List, Dict, Tuple
+from funciones.utilidades import CAMPOS_CSV, iterar_filas_csv
+
+
+# Caracteres no válidos en nombres de archivo -> '-'
+_TABLA_NOMBRE_ARCHIVO = str.maketrans({c: "-" for c in '/\\:*?"<>|'})
+
+
+# Extrae los valores de una fila en el orden de CAMPOS_CSV
+_CAMPOS_FILA = itemgetter(*CAMPOS_CSV)
+
+# Archivo (dentro de subgrupos/) con el SHA-256 del CSV central ya sincronizado
+ARCHIVO_HUELLA = ".sync_hash"
+
+# Archivo (dentro de cada carpeta de criterio) con la huella de cada CSV de grupo
+ARCHIVO_HUELLAS_GRUPOS = ".huellas.json"
+
+# Límites de cada rango: el valor va al rango i si cortes[i-1] <= valor < cortes[i]
+_CORTES_ESTUDIANTES = (300, 500, 700)
+_RANGOS_ESTUDIANTES = ("Menos_300", "300_499", "500_699", "700_o_mas")
+_CORTES_DECADAS = (1970, 1980, 1990, 2000)
+_DECADAS = ("Antes_1970", "1970_1979", "1980_1989", "1990_1999", "2000_o_despues")
+
+# Archivos de subgrupo abiertos a la vez, como máximo, al sincronizar fila a fila
+_MAX_ARCHIVOS_ABIERTOS = 64
 
 
 def obtener_ruta_subgrupos(ruta_db_central: str) -> Path:
@@ -31,25 +63,33 @@ def obtener_ruta_subgrupos(ruta_db_central: str) -> Path:
     return db_dir / "subgrupos"
 
 
+@lru_cache(maxsize=8)
+def _carpetas_subgrupos(ruta_db_central: str) -> Dict[str, Path]:
+    """Crea (una vez por proceso) y devuelve las carpetas de subgrupos.
+
+    Args:
+        ruta_db_central (str): Ruta del archivo CSV central.
+
+    Returns:
+        dict: Criterio ('por_provincia', 'por_estudiantes', 'por_año') -> carpeta.
+    """
+    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
+    carpetas = {tipo: base_subgrupos / tipo for tipo in ("por_provincia", "por_estudiantes", "por_año")}
+    for carpeta in carpetas.values():
+        carpeta.mkdir(parents=True, exist_ok=True)
+    return carpetas
+
+
 def inicializar_estructura_jerarquica(ruta_db_central: str) -> None:
     """Inicializa la estructura jerárquica de carpetas para subgrupos.
 
     Crea las carpetas base para organizar datos por provincia, cantidad de estudiantes y año.
+    Las carpetas se crean una sola vez por proceso para cada archivo central.
 
     Args:
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-
-    # Crear estructura de carpetas jerárquica
-    carpetas = [
-        base_subgrupos / "por_provincia",
-        base_subgrupos / "por_estudiantes",
-        base_subgrupos / "por_año",
-    ]
-
-    for carpeta in carpetas:
-        carpeta.mkdir(parents=True, exist_ok=True)
+    _carpetas_subgrupos(ruta_db_central)
 
 
 def limpiar_nombre_archivo(nombre: str) -> str:
@@ -63,15 +103,148 @@ def limpiar_nombre_archivo(nombre: str) -> str:
     Returns:
         str: Nombre limpio para archivo.
     """
-    # Reemplazar caracteres problemáticos
-    nombre = str(nombre).replace("/", "-").replace("\\", "-")
-    nombre = nombre.replace(":", "-").replace("*", "-")
-    nombre = nombre.replace("?", "-").replace('"', "-")
-    nombre = nombre.replace("<", "-").replace(">", "-")
-    nombre = nombre.replace("|", "-").strip()
+    # Reemplazar caracteres problemáticos en una sola pasada
+    nombre = str(nombre).translate(_TABLA_NOMBRE_ARCHIVO).strip()
     return nombre if nombre else "SinNombre"
 
 
+def escribir_subgrupo(ruta_archivo: Path, colegios: List[Dict]) -> None:
+    """Escribe un archivo CSV de subgrupo con los colegios indicados.
+
+    Usa `csv.writer` con filas como tuplas en el orden de `CAMPOS_CSV`, en
+    lugar de armar un diccionario por fila para `csv.DictWriter`. Los colegios
+    ya vienen con los tipos del esquema (ver `preparar_colegio`), así que los
+    valores se escriben sin convertir.
+
+    Args:
+        ruta_archivo (Path): Ruta del archivo CSV del subgrupo.
+        colegios (list[dict]): Colegios a escribir.
+    """
+    _escribir_filas(ruta_archivo, map(_CAMPOS_FILA, colegios))
+
+
+def _escribir_filas(ruta_archivo: Path, filas: Iterable[Tuple]) -> None:
+    """Escribe el encabezado y las filas (tuplas en el orden de `CAMPOS_CSV`).
+
+    Los subgrupos se escriben en UTF-8 sin BOM: solo los lee
+    `leer_desde_subgrupo`, que abre con `utf-8-sig` y acepta ambos.
+
+    Args:
+        ruta_archivo (Path): Ruta del archivo CSV del subgrupo.
+        filas (iterable[tuple]): Filas a escribir.
+    """
+    with open(ruta_archivo, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(CAMPOS_CSV)
+        writer.writerows(filas)
+
+
+def _huella_filas(filas: List[Tuple]) -> str:
+    """Calcula una huella corta (BLAKE2b de 8 bytes) del contenido de un grupo.
+
+    Args:
+        filas (list[tuple]): Filas del grupo, en el orden en que se escriben.
+
+    Returns:
+        str: Huella hexadecimal.
+    """
+    huella = hashlib.blake2b(digest_size=8)
+    for fila in filas:
+        huella.update(repr(fila).encode("utf-8"))
+        huella.update(b"\n")
+    return huella.hexdigest()
+
+
+def _firma_archivo(ruta_archivo: Path) -> List[int]:
+    """Devuelve [tamaño, mtime en ns] de un archivo, o [] si no existe.
+
+    Args:
+        ruta_archivo (Path): Ruta del archivo.
+
+    Returns:
+        list[int]: Tamaño y fecha de modificación del archivo.
+    """
+    try:
+        estado = os.stat(ruta_archivo)
+    except OSError:
+        return []
+    return [estado.st_size, estado.st_mtime_ns]
+
+
+def _leer_huellas_grupos(carpeta: Path) -> Dict[str, str]:
+    """Lee las huellas por archivo guardadas en una carpeta de subgrupos.
+
+    Args:
+        carpeta (Path): Carpeta del criterio.
+
+    Returns:
+        dict: Nombre de archivo -> [huella, tamaño, mtime] (vacío si no hay o es ilegible).
+    """
+    try:
+        with open(carpeta / ARCHIVO_HUELLAS_GRUPOS, "r", encoding="utf-8") as f:
+            huellas = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return huellas if isinstance(huellas, dict) else {}
+
+
+def rango_estudiantes(estudiantes: int) -> str:
+    """Devuelve el nombre del rango de estudiantes al que pertenece un colegio.
+
+    Args:
+        estudiantes (int): Cantidad de estudiantes.
+
+    Returns:
+        str: Nombre del rango (ej: '300_499').
+    """
+    return _RANGOS_ESTUDIANTES[bisect_right(_CORTES_ESTUDIANTES, estudiantes)]
+
+
+def decada_creacion(año: int) -> str:
+    """Devuelve el nombre de la década de creación de un colegio.
+
+    Args:
+        año (int): Año de creación.
+
+    Returns:
+        str: Nombre de la década (ej: '1990_1999').
+    """
+    return _DECADAS[bisect_right(_CORTES_DECADAS, año)]
+
+
+def escribir_grupos(carpeta: Path, grupos: Dict[str, List[Dict]]) -> None:
+    """Escribe un archivo CSV por grupo dentro de una carpeta de subgrupos.
+
+    Guarda una huella del contenido de cada archivo (junto con su tamaño y
+    mtime) en `ARCHIVO_HUELLAS_GRUPOS` y solo reescribe los grupos cuya huella
+    cambió o cuyo archivo fue modificado o borrado por fuera.
+
+    Args:
+        carpeta (Path): Carpeta del criterio (ej: subgrupos/por_provincia).
+        grupos (dict): Nombre del grupo -> colegios del grupo.
+    """
+    previas = _leer_huellas_grupos(carpeta)
+    nuevas = {}
+
+    for nombre, lista_colegios in grupos.items():
+        nombre_archivo = limpiar_nombre_archivo(nombre) + ".csv"
+        ruta_archivo = carpeta / nombre_archivo
+        filas = list(map(_CAMPOS_FILA, lista_colegios))
+        huella = _huella_filas(filas)
+
+        # Si el grupo no cambió y nadie tocó el archivo desde la última
+        # escritura (mismo tamaño y mtime), no se reescribe
+        previa = previas.get(nombre_archivo)
+        if previa and previa[0] == huella and previa[1:] == _firma_archivo(ruta_archivo):
+            nuevas[nombre_archivo] = previa
+            continue
+        _escribir_filas(ruta_archivo, filas)
+        nuevas[nombre_archivo] = [huella, *_firma_archivo(ruta_archivo)]
+
+    with open(carpeta / ARCHIVO_HUELLAS_GRUPOS, "w", encoding="utf-8") as f:
+        json.dump(nuevas, f, ensure_ascii=False)
+
+
 def organizar_por_provincia(colegios: List[Dict], ruta_db_central: str) -> None:
     """Organiza los colegios en subcarpetas agrupados por provincia.
 
@@ -81,33 +254,11 @@ def organizar_por_provincia(colegios: List[Dict], ruta_db_central: str) -> None:
         colegios (list[dict]): Lista de colegios a organizar.
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-    carpeta_provincia = base_subgrupos / "por_provincia"
-
-    # Agrupar colegios por provincia
-    colegios_por_provincia = {}
+    colegios_por_provincia = defaultdict(list)
     for colegio in colegios:
-        provincia = colegio.get("Provincia", "Desconocida")
-        if provincia not in colegios_por_provincia:
-            colegios_por_provincia[provincia] = []
-        colegios_por_provincia[provincia].append(colegio)
-
-    # Crear archivo CSV para cada provincia
-    for provincia, lista_colegios in colegios_por_provincia.items():
-        nombre_archivo = limpiar_nombre_archivo(provincia) + ".csv"
-        ruta_archivo = carpeta_provincia / nombre_archivo
-
-        fieldnames = ["Provincia", "Colegio", "Cantidad de Estudiantes", "Año de Creación"]
-        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for c in lista_colegios:
-                writer.writerow({
-                    "Provincia": str(c["Provincia"]),
-                    "Colegio": str(c["Colegio"]),
-                    "Cantidad de Estudiantes": int(c["Cantidad de Estudiantes"]),
-                    "Año de Creación": int(c["Año de Creación"]),
-                })
+        colegios_por_provincia[colegio.get("Provincia", "Desconocida")].append(colegio)
+
+    escribir_grupos(_carpetas_subgrupos(ruta_db_central)["por_provincia"], colegios_por_provincia)
 
 
 def organizar_por_estudiantes(colegios: List[Dict], ruta_db_central: str) -> None:
@@ -119,44 +270,11 @@ def organizar_por_estudiantes(colegios: List[Dict], ruta_db_central: str) -> Non
         colegios (list[dict]): Lista de colegios a organizar.
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-    carpeta_estudiantes = base_subgrupos / "por_estudiantes"
-
-    # Agrupar colegios por rango de estudiantes
-    colegios_por_rango = {}
+    colegios_por_rango = defaultdict(list)
     for colegio in colegios:
-        estudiantes = colegio.get("Cantidad de Estudiantes", 0)
-        
-        # Definir rangos
-        if estudiantes < 300:
-            rango = "Menos_300"
-        elif estudiantes < 500:
-            rango = "300_499"
-        elif estudiantes < 700:
-            rango = "500_699"
-        else:
-            rango = "700_o_mas"
-        
-        if rango not in colegios_por_rango:
-            colegios_por_rango[rango] = []
-        colegios_por_rango[rango].append(colegio)
-
-    # Crear archivo CSV para cada rango
-    for rango, lista_colegios in colegios_por_rango.items():
-        nombre_archivo = limpiar_nombre_archivo(rango) + ".csv"
-        ruta_archivo = carpeta_estudiantes / nombre_archivo
-
-        fieldnames = ["Provincia", "Colegio", "Cantidad de Estudiantes", "Año de Creación"]
-        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for c in lista_colegios:
-                writer.writerow({
-                    "Provincia": str(c["Provincia"]),
-                    "Colegio": str(c["Colegio"]),
-                    "Cantidad de Estudiantes": int(c["Cantidad de Estudiantes"]),
-                    "Año de Creación": int(c["Año de Creación"]),
-                })
+        colegios_por_rango[rango_estudiantes(colegio.get("Cantidad de Estudiantes", 0))].append(colegio)
+
+    escribir_grupos(_carpetas_subgrupos(ruta_db_central)["por_estudiantes"], colegios_por_rango)
 
 
 def organizar_por_año(colegios: List[Dict], ruta_db_central: str) -> None:
@@ -168,67 +286,216 @@ def organizar_por_año(colegios: List[Dict], ruta_db_central: str) -> None:
         colegios (list[dict]): Lista de colegios a organizar.
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-    carpeta_año = base_subgrupos / "por_año"
-
-    # Agrupar colegios por década
-    colegios_por_decada = {}
+    colegios_por_decada = defaultdict(list)
     for colegio in colegios:
-        año = colegio.get("Año de Creación", 0)
-        
-        # Definir décadas
-        if año < 1970:
-            decada = "Antes_1970"
-        elif año < 1980:
-            decada = "1970_1979"
-        elif año < 1990:
-            decada = "1980_1989"
-        elif año < 2000:
-            decada = "1990_1999"
-        else:
-            decada = "2000_o_despues"
-        
-        if decada not in colegios_por_decada:
-            colegios_por_decada[decada] = []
-        colegios_por_decada[decada].append(colegio)
-
-    # Crear archivo CSV para cada década
-    for decada, lista_colegios in colegios_por_decada.items():
-        nombre_archivo = limpiar_nombre_archivo(decada) + ".csv"
-        ruta_archivo = carpeta_año / nombre_archivo
-
-        fieldnames = ["Provincia", "Colegio", "Cantidad de Estudiantes", "Año de Creación"]
-        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for c in lista_colegios:
-                writer.writerow({
-                    "Provincia": str(c["Provincia"]),
-                    "Colegio": str(c["Colegio"]),
-                    "Cantidad de Estudiantes": int(c["Cantidad de Estudiantes"]),
-                    "Año de Creación": int(c["Año de Creación"]),
-                })
+        colegios_por_decada[decada_creacion(colegio.get("Año de Creación", 0))].append(colegio)
+
+    escribir_grupos(_carpetas_subgrupos(ruta_db_central)["por_año"], colegios_por_decada)
+
+
+def _huella_archivo(ruta: str) -> str | None:
+    """Calcula el SHA-256 de un archivo mapeándolo en memoria.
+
+    Con `mmap` el hash lee directamente las páginas del archivo, sin copiarlo
+    por bloques a buffers de Python.
+
+    Args:
+        ruta (str): Ruta del archivo.
+
+    Returns:
+        str | None: Huella hexadecimal, o None si el archivo no se puede leer.
+    """
+    try:
+        with open(ruta, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                    return hashlib.sha256(mapa).hexdigest()
+            except ValueError:
+                # Archivo vacío: mmap no admite longitud 0
+                return hashlib.sha256().hexdigest()
+    except OSError:
+        return None
 
 
-def sincronizar_estructura_jerarquica(colegios: List[Dict], ruta_db_central: str) -> None:
+def _leer_huella_sincronizada(ruta_db_central: str) -> str | None:
+    """Lee la huella del archivo central guardada en la última sincronización.
+
+    Args:
+        ruta_db_central (str): Ruta del archivo CSV central.
+
+    Returns:
+        str | None: Huella guardada, o None si no existe.
+    """
+    try:
+        return (obtener_ruta_subgrupos(ruta_db_central) / ARCHIVO_HUELLA).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def _subgrupos_intactos(carpetas: Dict[str, Path]) -> bool:
+    """Indica si ningún archivo de subgrupo cambió desde la última escritura.
+
+    Compara el tamaño y el mtime de cada archivo con los guardados en
+    `ARCHIVO_HUELLAS_GRUPOS`. Sin ese registro no se puede asegurar nada.
+
+    Args:
+        carpetas (dict): Criterio -> carpeta (ver `_carpetas_subgrupos`).
+
+    Returns:
+        bool: True si todos los archivos registrados siguen igual.
+    """
+    for carpeta in carpetas.values():
+        huellas = _leer_huellas_grupos(carpeta)
+        if not huellas and not (carpeta / ARCHIVO_HUELLAS_GRUPOS).exists():
+            return False
+        for nombre_archivo, huella in huellas.items():
+            if huella[1:] != _firma_archivo(carpeta / nombre_archivo):
+                return False
+    return True
+
+
+def sincronizar_estructura_jerarquica(colegios: List[Dict], ruta_db_central: str) -> bool:
     """Sincroniza la estructura jerárquica completa con los datos actuales.
 
     Esta función:
     1. Inicializa la estructura de carpetas si no existe
-    2. Organiza los datos en subcarpetas por provincia, estudiantes y año
-    3. Mantiene la sincronización entre el archivo central y los subgrupos
+    2. Compara el SHA-256 del archivo central con el de la última sincronización
+       y, si coinciden y ningún archivo de subgrupo cambió, no reescribe nada
+    3. Clasifica cada colegio por provincia, estudiantes y año en una sola pasada
+    4. Escribe los archivos de las tres subcarpetas en paralelo y guarda la nueva huella
 
     Args:
         colegios (list[dict]): Lista completa de colegios desde el archivo central.
         ruta_db_central (str): Ruta del archivo CSV central.
+
+    Returns:
+        bool: True si se reescribieron los subgrupos, False si ya estaban al día.
     """
     # Inicializar estructura si no existe
-    inicializar_estructura_jerarquica(ruta_db_central)
+    carpetas = _carpetas_subgrupos(ruta_db_central)
+
+    # Si el archivo central no cambió desde la última sincronización y nadie
+    # tocó los subgrupos por fuera, no hay nada que hacer
+    huella = _huella_archivo(ruta_db_central)
+    if (huella is not None and huella == _leer_huella_sincronizada(ruta_db_central)
+            and _subgrupos_intactos(carpetas)):
+        return False
+
+    # Clasificar cada colegio en los tres criterios a la vez
+    por_provincia = defaultdict(list)
+    por_rango = defaultdict(list)
+    por_decada = defaultdict(list)
+    for colegio in colegios:
+        obtener = colegio.get
+        por_provincia[obtener("Provincia", "Desconocida")].append(colegio)
+        por_rango[rango_estudiantes(obtener("Cantidad de Estudiantes", 0))].append(colegio)
+        por_decada[decada_creacion(obtener("Año de Creación", 0))].append(colegio)
+
+    # Escribir los subgrupos jerárquicos: cada criterio en su propio hilo, ya
+    # que las escrituras a disco liberan el GIL. result() propaga los errores.
+    with ThreadPoolExecutor(max_workers=3) as ejecutor:
+        tareas = [
+            ejecutor.submit(escribir_grupos, carpetas["por_provincia"], por_provincia),
+            ejecutor.submit(escribir_grupos, carpetas["por_estudiantes"], por_rango),
+            ejecutor.submit(escribir_grupos, carpetas["por_año"], por_decada),
+        ]
+        for tarea in tareas:
+            tarea.result()
+
+    if huella is not None:
+        (obtener_ruta_subgrupos(ruta_db_central) / ARCHIVO_HUELLA).write_text(huella, encoding="utf-8")
+
+    return True
+
+
+def sincronizar_desde_archivo(ruta_db_central: str) -> int:
+    """Sincroniza la estructura jerárquica leyendo el CSV central fila a fila.
 
-    # Organizar datos en subgrupos jerárquicos
-    organizar_por_provincia(colegios, ruta_db_central)
-    organizar_por_estudiantes(colegios, ruta_db_central)
-    organizar_por_año(colegios, ruta_db_central)
+    A diferencia de `sincronizar_estructura_jerarquica`, no necesita la lista
+    de colegios en memoria: cada fila se escribe directamente en los archivos
+    de sus tres subgrupos, que se abren la primera vez que se usan. Como mucho
+    quedan `_MAX_ARCHIVOS_ABIERTOS` abiertos a la vez; el resto se cierra y se
+    reabre para agregar filas cuando vuelve a hacer falta.
+
+    Args:
+        ruta_db_central (str): Ruta del archivo CSV central.
+
+    Returns:
+        int: Cantidad de colegios sincronizados (0 si ya estaba al día).
+    """
+    carpetas = _carpetas_subgrupos(ruta_db_central)
+
+    # Si el archivo central no cambió desde la última sincronización y nadie
+    # tocó los subgrupos por fuera, no hay nada que hacer
+    huella = _huella_archivo(ruta_db_central)
+    if (huella is not None and huella == _leer_huella_sincronizada(ruta_db_central)
+            and _subgrupos_intactos(carpetas)):
+        return 0
+
+    # Los archivos se reescriben sin calcular huellas por grupo: descartar las
+    # guardadas para que la próxima escritura desde memoria no confíe en ellas
+    for carpeta in carpetas.values():
+        try:
+            os.remove(carpeta / ARCHIVO_HUELLAS_GRUPOS)
+        except FileNotFoundError:
+            pass
+
+    # Clave (carpeta, grupo) -> (archivo, escritor), del menos al más usado
+    abiertos = OrderedDict()
+    # Grupos cuyo archivo ya se creó en esta pasada (se reabren para agregar)
+    creados = set()
+
+    def escritor_para(carpeta: Path, nombre: str):
+        clave = (carpeta, nombre)
+        abierto = abiertos.get(clave)
+        if abierto is not None:
+            abiertos.move_to_end(clave)
+            return abierto[1]
+
+        # Las provincias son texto libre: limitar los archivos abiertos a la
+        # vez cerrando el usado hace más tiempo
+        if len(abiertos) >= _MAX_ARCHIVOS_ABIERTOS:
+            _, (archivo_viejo, _) = abiertos.popitem(last=False)
+            archivo_viejo.close()
+
+        ruta_archivo = carpeta / (limpiar_nombre_archivo(nombre) + ".csv")
+        modo = "a" if clave in creados else "w"
+        f = open(ruta_archivo, modo, encoding="utf-8", newline="")
+        escritor = csv.writer(f)
+        if modo == "w":
+            escritor.writerow(CAMPOS_CSV)
+            creados.add(clave)
+        abiertos[clave] = (f, escritor)
+        return escritor
+
+    cantidad = 0
+    try:
+        with open(ruta_db_central, "r", encoding="utf-8-sig", newline="", buffering=1 << 18) as f:
+            for fila in iterar_filas_csv(f, avisar=False):
+                provincia, _, estudiantes, año = fila
+                escritor_para(carpetas["por_provincia"], provincia).writerow(fila)
+                escritor_para(carpetas["por_estudiantes"], rango_estudiantes(estudiantes)).writerow(fila)
+                escritor_para(carpetas["por_año"], decada_creacion(año)).writerow(fila)
+                cantidad += 1
+    finally:
+        for archivo, _ in abiertos.values():
+            archivo.close()
+
+    # Registrar tamaño y mtime de cada archivo escrito, con la huella de
+    # contenido vacía: así se detectan cambios hechos por fuera, y la próxima
+    # escritura desde memoria igual reescribe cada grupo
+    firmas = {carpeta: {} for carpeta in carpetas.values()}
+    for carpeta, nombre in creados:
+        nombre_archivo = limpiar_nombre_archivo(nombre) + ".csv"
+        firmas[carpeta][nombre_archivo] = ["", *_firma_archivo(carpeta / nombre_archivo)]
+    for carpeta, huellas in firmas.items():
+        with open(carpeta / ARCHIVO_HUELLAS_GRUPOS, "w", encoding="utf-8") as f:
+            json.dump(huellas, f, ensure_ascii=False)
+
+    if huella is not None:
+        (obtener_ruta_subgrupos(ruta_db_central) / ARCHIVO_HUELLA).write_text(huella, encoding="utf-8")
+
+    return cantidad
 
 
 def leer_desde_subgrupo(ruta_subgrupo: str) -> List[Dict]:
@@ -245,23 +512,8 @@ def leer_desde_subgrupo(ruta_subgrupo: str) -> List[Dict]:
         return colegios
 
     try:
-        with open(ruta_subgrupo, "r", encoding="utf-8-sig", newline="") as f:
-            lector = csv.DictReader(f)
-            for fila in lector:
-                provincia = fila.get("Provincia", "").strip()
-                colegio = fila.get("Colegio", "").strip()
-                cantidad_str = fila.get("Cantidad de Estudiantes", "").strip()
-                año_str = fila.get("Año de Creación", "").strip()
-
-                if not provincia or not colegio:
-                    continue
-
-                try:
-                    cantidad_estudiantes = int(cantidad_str) if cantidad_str else 0
-                    año_creacion = int(año_str) if año_str else 0
-                except ValueError:
-                    continue
-
+        with open(ruta_subgrupo, "r", encoding="utf-8-sig", newline="", buffering=1 << 18) as f:
+            for provincia, colegio, cantidad_estudiantes, año_creacion in iterar_filas_csv(f, avisar=False):
                 colegios.append({
                     "Provincia": provincia,
                     "Colegio": colegio,
@@ -294,18 +546,16 @@ def obtener_info_estructura_jerarquica(ruta_db_central: str) -> Dict:
 
     # Contar archivos en cada subcarpeta
     for tipo in ["por_provincia", "por_estudiantes", "por_año"]:
-        carpeta = base_subgrupos / tipo
-        if carpeta.exists():
-            archivos = list(carpeta.glob("*.csv"))
-            info[tipo] = {
-                "cantidad_archivos": len(archivos),
-                "archivos": [arch.name for arch in archivos],
-            }
-        else:
-            info[tipo] = {
-                "cantidad_archivos": 0,
-                "archivos": [],
-            }
+        # os.scandir devuelve solo nombres y tipo de entrada, sin crear un Path por archivo
+        try:
+            with os.scandir(base_subgrupos / tipo) as entradas:
+                archivos = [e.name for e in entradas if e.name.endswith(".csv") and e.is_file()]
+        except OSError:
+            archivos = []
+        info[tipo] = {
+            "cantidad_archivos": len(archivos),
+            "archivos": archivos,
+        }
 
     return info
 
@@ -4,48 +4,233 @@ Este módulo adapta las funciones locales para trabajar con datos obtenidos
 desde la API en http://149.50.150.15:8020.
 """
 
+import atexit
 import os
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
+
+import requests
+
 from funciones import cliente_api
 from funciones.vista import mostrar_colegios, ordenar_colegios
 from funciones.busqueda import buscar_colegio, filtrar_por_provincia, filtrar_por_rango_estudiantes, filtrar_por_rango_año
-from funciones.estadisticas import mostrar_estadisticas
-from funciones.utilidades import escribir_csv
+from funciones.estadisticas import mostrar_estadisticas, imprimir_estadisticas
+from funciones.utilidades import (
+    CAMPOS_CSV,
+    agregar_fila_csv,
+    escribir_csv_en_streaming,
+    preparar_colegio,
+    reemplazar_fila_csv,
+)
+
+# CSV local que se mantiene sincronizado con la API
+_DB_PATH = str(Path(__file__).resolve().parent.parent / "base_de_datos" / "colegios.csv")
+
+# Con la variable de entorno COLEGIOS_DEBUG definida, los errores de la API
+# muestran además el traceback completo
+_DEBUG = bool(os.environ.get("COLEGIOS_DEBUG"))
+
+# Un solo hilo para las sincronizaciones con el CSV local: se ejecutan en orden.
+# Al salir del programa se espera a que terminen las pendientes.
+_hilo_sincronizacion = ThreadPoolExecutor(max_workers=1)
+atexit.register(_hilo_sincronizacion.shutdown, wait=True)
+_candado_sincronizacion = threading.Lock()
+_sincronizacion_pendiente: Optional[Future] = None
+
+# Campos que se muestran al elegir un colegio para editar o borrar
+_CAMPOS_OPCION = itemgetter("Colegio", "Provincia", "Cantidad de Estudiantes", "Año de Creación")
+
+# Colegios por página al listar ordenado desde la API
+TAMAÑO_PAGINA = 50
+
+# Si el servidor ofrece `/colegios/stats`; se desactiva si responde que no existe
+_STATS_EN_SERVIDOR = True
+# Respuestas que indican que el endpoint no existe. Sin la ruta de
+# estadísticas, `/colegios/stats` cae en `/colegios/{id}` y da 422.
+_SIN_ENDPOINT = frozenset({404, 405, 422})
+_CLAVES_ESTADISTICAS = frozenset({
+    "colegio_mas_antiguo",
+    "colegio_mas_nuevo",
+    "promedio_año",
+    "total_estudiantes",
+    "promedio_estudiantes",
+    "colegio_mas_estudiantes",
+    "colegio_menos_estudiantes",
+    "colegios_por_provincia",
+})
+
+
+def _mostrar_opciones(colegios: List[Dict]) -> None:
+    """Muestra los colegios numerados, con su ID, para elegir uno.
+
+    Las líneas se arman primero y se imprimen con un solo `print`, en lugar de
+    una escritura a la terminal por colegio.
+
+    Args:
+        colegios (list[dict]): Colegios preparados con `preparar_colegio` (tienen
+            siempre los cuatro campos del CSV; el `id` puede faltar).
+    """
+    lineas = []
+    for i, c in enumerate(colegios, 1):
+        nombre, provincia, estudiantes, año = _CAMPOS_OPCION(c)
+        lineas.append(
+            f"{i}. [ID: {c.get('id', 'N/A')}] {nombre} | "
+            f"Provincia: {provincia} | "
+            f"Estudiantes: {estudiantes} | "
+            f"Año: {año}"
+        )
+    print("\n".join(lineas))
+
+
+def _campos_csv(colegio: Dict) -> Tuple:
+    """Devuelve los valores de un colegio en el orden de `CAMPOS_CSV`."""
+    return tuple(colegio.get(campo) for campo in CAMPOS_CSV)
+
+
+def _aplicar_cambio_local(operacion: str, colegio: Dict, cambios: Optional[Dict]) -> bool:
+    """Aplica en el CSV local un único cambio ya hecho en la API.
+
+    El CSV no guarda el ID de la API, así que la fila se identifica por sus
+    cuatro campos tal como estaban antes del cambio. Al agregar solo se escribe
+    la fila nueva; al editar o borrar el archivo se reescribe en streaming, sin
+    cargar la lista de colegios.
+
+    Args:
+        operacion (str): 'agregar', 'editar' o 'borrar'.
+        colegio (dict): Colegio agregado, o el colegio antes de editarlo/borrarlo.
+        cambios (dict | None): Campos modificados (solo para 'editar').
+
+    Returns:
+        bool: True si se aplicó; False si el CSV local no tenía la fila esperada.
+    """
+    valores = {campo: colegio.get(campo) for campo in CAMPOS_CSV}
+
+    if operacion == "agregar":
+        # Se agrega la fila sin leer el CSV
+        return agregar_fila_csv(_DB_PATH, preparar_colegio(valores))
+
+    if operacion == "editar":
+        reemplazo = preparar_colegio({**valores, **(cambios or {})})
+    else:
+        reemplazo = None
+    return reemplazar_fila_csv(_DB_PATH, _campos_csv(colegio), reemplazo)
 
 
-def _sincronizar_api_con_local():
+def _sincronizar_api_con_local(
+    operacion: Optional[str] = None,
+    colegio: Optional[Dict] = None,
+    cambios: Optional[Dict] = None,
+):
     """Sincroniza la estructura jerárquica local con los datos de la API.
-    
-    Obtiene todos los colegios desde la API y los escribe en el archivo CSV local,
-    lo que activa automáticamente la sincronización de la estructura jerárquica.
+
+    Con `operacion`, aplica solo ese cambio sobre el CSV local (una fila) sin
+    volver a descargar la lista. Sin `operacion`, o si el CSV local no coincide
+    con lo esperado, obtiene todos los colegios desde la API y reescribe el CSV
+    local. En ambos casos se sincroniza la estructura jerárquica.
+    Se ejecuta en segundo plano (ver `_programar_sincronizacion`); el candado
+    evita que dos sincronizaciones escriban el CSV a la vez.
+
+    Args:
+        operacion (str | None): 'agregar', 'editar' o 'borrar'.
+        colegio (dict | None): Colegio agregado, o el colegio antes del cambio.
+        cambios (dict | None): Campos modificados (solo para 'editar').
     """
-    try:
-        # Obtener todos los colegios desde la API
-        colegios_api = obtener_colegios_api()
-        
-        if not colegios_api:
-            # Si no hay datos en la API, no hay nada que sincronizar
-            return
-        
-        # Obtener la ruta del archivo CSV local
-        # Buscar la ruta del proyecto desde el módulo actual
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent.parent
-        db_path = project_root / "src" / "base_de_datos" / "colegios.csv"
-        
-        # Si el archivo no existe, crearlo
-        if not db_path.exists():
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Escribir los datos de la API en el archivo local
-        # Esto activará automáticamente la sincronización jerárquica
-        escribir_csv(str(db_path), colegios_api)
-        
-    except Exception as e:
-        # Si hay error, continuar sin afectar la operación de API
-        # No mostrar error para no confundir al usuario
-        pass
+    with _candado_sincronizacion:
+        try:
+            if operacion and colegio and os.path.exists(_DB_PATH):
+                if _aplicar_cambio_local(operacion, colegio, cambios):
+                    return
+
+            # Volcar todos los colegios de la API en el archivo local a medida
+            # que llegan, sin tener la lista completa en memoria. Si la API no
+            # devuelve nada, el CSV local queda como estaba. Esto también
+            # sincroniza la estructura jerárquica.
+            escribir_csv_en_streaming(_DB_PATH, cliente_api.iterar_colegios())
+
+        except Exception as e:
+            # Si hay error, continuar sin afectar la operación de API. No se
+            # muestra para no confundir al usuario, salvo con COLEGIOS_DEBUG:
+            # el CSV local puede haber quedado distinto de la API.
+            if _DEBUG:
+                print(f"\n⚠️ No se pudo sincronizar el CSV local con la API: {e}")
+                traceback.print_exc()
+
+
+@lru_cache(maxsize=32)
+def _listar_preparados(filtros: Tuple, vigencia: Tuple[int, int]):
+    """Lista colegios desde la API y los prepara para las funciones locales.
+
+    El resultado se cachea con la misma vigencia que las lecturas de
+    `cliente_api` (`vigencia` solo forma parte de la clave), así una misma
+    consulta repetida no vuelve a normalizar cada colegio.
+
+    Args:
+        filtros (tuple): (q, provincia, sort_by, desc, min_estudiantes,
+            max_estudiantes, min_año, max_año, campos, limit, offset).
+        vigencia (tuple[int, int]): Clave de `cliente_api.vigencia_cache()`.
+
+    Returns:
+        Any: Lista de colegios preparados, o lo que haya devuelto la API si no
+            es una lista.
+    """
+    (q, provincia, sort_by, desc, min_estudiantes, max_estudiantes, min_año, max_año,
+     campos, limit, offset) = filtros
+    items = cliente_api.listar_colegios(
+        q=q,
+        provincia=provincia,
+        ordenar_por=sort_by,
+        descendente=desc,
+        min_estudiantes=min_estudiantes,
+        max_estudiantes=max_estudiantes,
+        min_año=min_año,
+        max_año=max_año,
+        campos=campos,
+        limite=limit,
+        desplazamiento=offset,
+    )
+    if isinstance(items, list):
+        # Las funciones de búsqueda locales esperan las claves normalizadas.
+        # Se preparan copias: los dicts de `items` son los del caché de
+        # `cliente_api` y no deben modificarse.
+        items = [preparar_colegio(dict(item)) for item in items]
+    return items
+
+
+def _programar_sincronizacion(
+    operacion: Optional[str] = None,
+    colegio: Optional[Dict] = None,
+    cambios: Optional[Dict] = None,
+) -> None:
+    """Lanza `_sincronizar_api_con_local` en segundo plano.
+
+    El usuario vuelve al menú sin esperar la escritura del CSV. Las
+    sincronizaciones se ejecutan de a una y en orden.
+
+    Args:
+        operacion (str | None): 'agregar', 'editar' o 'borrar'.
+        colegio (dict | None): Colegio agregado, o el colegio antes del cambio.
+        cambios (dict | None): Campos modificados (solo para 'editar').
+    """
+    global _sincronizacion_pendiente
+    _sincronizacion_pendiente = _hilo_sincronizacion.submit(
+        _sincronizar_api_con_local, operacion, colegio, cambios
+    )
+
+
+def esperar_sincronizacion() -> None:
+    """Espera a que termine la última sincronización en segundo plano, si hay una.
+
+    Debe llamarse antes de leer el CSV local (por ejemplo, al pasar a modo local)
+    o de cerrar la sesión HTTP.
+    """
+    pendiente = _sincronizacion_pendiente
+    if pendiente is not None:
+        pendiente.result()
 
 
 def obtener_colegios_api(
@@ -53,6 +238,13 @@ def obtener_colegios_api(
     provincia: Optional[str] = None,
     sort_by: Optional[str] = None,
     desc: bool = False,
+    min_estudiantes: Optional[int] = None,
+    max_estudiantes: Optional[int] = None,
+    min_año: Optional[int] = None,
+    max_año: Optional[int] = None,
+    campos: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
 ) -> List[Dict]:
     """Obtiene colegios desde la API con filtros opcionales.
 
@@ -61,23 +253,35 @@ def obtener_colegios_api(
         provincia (str | None): Filtro por provincia.
         sort_by (str | None): Campo de ordenamiento (Provincia, Colegio, Cantidad de Estudiantes, Año de Creación).
         desc (bool): Si True, orden descendente.
+        min_estudiantes (int | None): Cantidad mínima de estudiantes.
+        max_estudiantes (int | None): Cantidad máxima de estudiantes.
+        min_año (int | None): Año de creación mínimo.
+        max_año (int | None): Año de creación máximo.
+        campos (Sequence[str] | None): Columnas que necesita el llamador (ver
+            `cliente_api.listar_colegios`). Por defecto, todas.
+        limit (int | None): Cantidad máxima de colegios (una página).
+        offset (int | None): Cantidad de colegios a saltear.
 
     Returns:
         list[dict]: Lista de colegios con estructura: Provincia, Colegio, Cantidad de Estudiantes, Año de Creación.
     """
     try:
-        items = cliente_api.listar_colegios(
-            q=q,
-            provincia=provincia,
-            ordenar_por=sort_by,
-            descendente=desc,
+        filtros = (
+            q, provincia, sort_by, desc, min_estudiantes, max_estudiantes, min_año, max_año,
+            tuple(campos) if campos else None, limit, offset,
         )
+        items = _listar_preparados(filtros, cliente_api.vigencia_cache())
 
         # Verificar que items sea una lista
         if not isinstance(items, list):
             print(f"Error: La API no devolvió una lista. Tipo recibido: {type(items)}")
             return []
 
+        # Con filtros (o pasada la primera página), una lista vacía solo
+        # significa que no hubo coincidencias
+        if len(items) == 0 and (offset or any(f is not None for f in (q, provincia, min_estudiantes, max_estudiantes, min_año, max_año))):
+            return []
+
         # Verificar si la lista está vacía
         if len(items) == 0:
             print(f"\nLa API no tiene datos disponibles.")
@@ -85,11 +289,11 @@ def obtener_colegios_api(
             print(f"   Necesitás cargar datos primero usando la opción 'Agregar un colegio' del menú.")
             return []
 
-        return items
+        return list(items)
     except Exception as e:
         print(f"Error al obtener colegios desde la API: {e}")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            traceback.print_exc()
         return []
 
 
@@ -126,11 +330,11 @@ def filtrar_rango_estudiantes_api(minimo: int, maximo: int) -> None:
         minimo (int): Cantidad mínima de estudiantes.
         maximo (int): Cantidad máxima de estudiantes.
     """
-    colegios = obtener_colegios_api()
+    colegios = obtener_colegios_api(min_estudiantes=minimo, max_estudiantes=maximo)
     if colegios:
         filtrar_por_rango_estudiantes(colegios, minimo, maximo)
     else:
-        print("\nNo se pudieron obtener datos de la API.")
+        print("\nNo se encontraron colegios en ese rango de estudiantes.")
 
 
 def filtrar_rango_año_api(minimo: int, maximo: int) -> None:
@@ -140,34 +344,99 @@ def filtrar_rango_año_api(minimo: int, maximo: int) -> None:
         minimo (int): Año mínimo.
         maximo (int): Año máximo.
     """
-    colegios = obtener_colegios_api()
+    colegios = obtener_colegios_api(min_año=minimo, max_año=maximo)
     if colegios:
         filtrar_por_rango_año(colegios, minimo, maximo)
     else:
-        print("\nNo se pudieron obtener datos de la API.")
+        print("\nNo se encontraron colegios creados en ese rango de años.")
 
 
-def ordenar_colegios_api(campo: str, descendente: bool = False) -> None:
-    """Ordena y muestra colegios obtenidos desde la API.
+def ordenar_colegios_api(campo: str, descendente: bool = False, por_pagina: int = TAMAÑO_PAGINA) -> None:
+    """Ordena y muestra colegios obtenidos desde la API, de a una página.
+
+    El servidor ordena y devuelve solo la página pedida; `mostrar_colegios` no
+    vuelve a ordenar. Si el servidor no pagina, se muestra todo de una vez; si
+    pagina pero ignora `offset`, se corta cuando la página se repite.
 
     Args:
         campo (str): Campo por el cual ordenar.
         descendente (bool): Si True, orden descendente.
+        por_pagina (int): Cantidad de colegios por página.
     """
-    colegios = obtener_colegios_api(sort_by=campo, desc=descendente)
-    if colegios:
+    desde = 0
+    primero_anterior = None
+    while True:
+        colegios = obtener_colegios_api(sort_by=campo, desc=descendente, limit=por_pagina, offset=desde)
+        if not colegios:
+            if desde == 0:
+                print("\nNo se pudieron obtener datos de la API.")
+            return
+        if colegios[0] == primero_anterior:
+            # El servidor ignora `offset` y repite la misma página
+            print("\nNo hay más colegios para mostrar.")
+            return
+
         mostrar_colegios(colegios)
-    else:
-        print("\nNo se pudieron obtener datos de la API.")
+        if len(colegios) < por_pagina:
+            # Última página
+            return
+        if desde == 0 and len(colegios) > por_pagina:
+            # El servidor ignora `limit` y devolvió todo
+            return
+
+        primero_anterior = colegios[0]
+        desde += por_pagina
+        ver_mas = input(f"\n¿Ver los siguientes {por_pagina}? (s/n): ").strip().lower()
+        if ver_mas != 's':
+            return
+
+
+def _estadisticas_servidor() -> Optional[Dict]:
+    """Pide a la API las estadísticas ya calculadas.
+
+    Si el servidor no tiene el endpoint (404, 405 o 422), se recuerda para no
+    volver a intentarlo en esta sesión. Ante cualquier otro error, o una
+    respuesta sin el formato esperado, solo esta vez se calculan localmente.
+
+    Returns:
+        dict | None: Estadísticas, o None si hay que calcularlas localmente.
+    """
+    global _STATS_EN_SERVIDOR
+    if not _STATS_EN_SERVIDOR:
+        return None
+    try:
+        estadisticas = cliente_api.obtener_estadisticas()
+    except requests.HTTPError as e:
+        if cliente_api.codigo_estado(e) in _SIN_ENDPOINT:
+            _STATS_EN_SERVIDOR = False
+        return None
+    except (requests.RequestException, ValueError, TypeError):
+        # Error de conexión o respuesta que no es un objeto JSON
+        return None
+    if not _CLAVES_ESTADISTICAS.issubset(estadisticas):
+        return None
+    return estadisticas
 
 
 def estadisticas_api() -> None:
-    """Muestra estadísticas de los colegios obtenidos desde la API."""
-    colegios = obtener_colegios_api()
-    if colegios:
-        mostrar_estadisticas(colegios)
-    else:
-        print("\nNo se pudieron obtener datos de la API.")
+    """Muestra estadísticas de los colegios obtenidos desde la API.
+
+    Usa los agregados de `/colegios/stats` si el servidor los ofrece; si no,
+    los calcula localmente en una sola pasada mientras los colegios llegan de
+    la API, sin armar la lista completa.
+    """
+    estadisticas = _estadisticas_servidor()
+    if estadisticas is not None:
+        imprimir_estadisticas(estadisticas)
+        return
+
+    try:
+        # Las estadísticas usan las cuatro columnas del CSV, pero no el `id`
+        mostrar_estadisticas(cliente_api.iterar_colegios(campos=CAMPOS_CSV))
+    except Exception as e:
+        print(f"\nNo se pudieron obtener datos de la API: {e}")
+        if _DEBUG:
+            traceback.print_exc()
 
 
 def agregar_colegio_api() -> bool:
@@ -213,8 +482,13 @@ def agregar_colegio_api() -> bool:
 
         print(f"\nColegio '{colegio}' agregado correctamente en la API.")
         
-        # Sincronizar estructura jerárquica local después de crear en API
-        _sincronizar_api_con_local()
+        # Sincronizar estructura jerárquica local (en segundo plano) después de crear en API
+        _programar_sincronizacion("agregar", {
+            "Provincia": provincia,
+            "Colegio": colegio,
+            "Cantidad de Estudiantes": cantidad_estudiantes,
+            "Año de Creación": año_creacion,
+        })
         
         return True
 
@@ -247,14 +521,7 @@ def editar_colegio_api() -> bool:
         # Si hay múltiples resultados, mostrar y seleccionar
         if len(colegios) > 1:
             print(f"\nSe encontraron {len(colegios)} colegios:")
-            for i, c in enumerate(colegios, 1):
-                colegio_id = c.get('id', 'N/A')
-                print(
-                    f"{i}. [ID: {colegio_id}] {c.get('Colegio', '')} | "
-                    f"Provincia: {c.get('Provincia', '')} | "
-                    f"Estudiantes: {c.get('Cantidad de Estudiantes', 0)} | "
-                    f"Año: {c.get('Año de Creación', 0)}"
-                )
+            _mostrar_opciones(colegios)
 
             try:
                 opcion = int(input("\nIngrese el número del colegio a editar: ")) - 1
@@ -311,8 +578,8 @@ def editar_colegio_api() -> bool:
         cliente_api.actualizar_colegio_parcial(id_colegio, cambios)
         print(f"\nColegio actualizado correctamente en la API.")
         
-        # Sincronizar estructura jerárquica local después de actualizar en API
-        _sincronizar_api_con_local()
+        # Sincronizar estructura jerárquica local (en segundo plano) después de actualizar en API
+        _programar_sincronizacion("editar", colegio_editar, cambios)
         
         return True
 
@@ -343,14 +610,7 @@ def borrar_colegio_api() -> bool:
 
         # Mostrar colegios con ID para que el usuario pueda verlo
         print(f"\nSe encontraron {len(colegios)} colegio(s):")
-        for i, c in enumerate(colegios, 1):
-            colegio_id = c.get('id', 'N/A')
-            print(
-                f"{i}. [ID: {colegio_id}] {c.get('Colegio', '')} | "
-                f"Provincia: {c.get('Provincia', '')} | "
-                f"Estudiantes: {c.get('Cantidad de Estudiantes', 0)} | "
-                f"Año: {c.get('Año de Creación', 0)}"
-            )
+        _mostrar_opciones(colegios)
 
         # Si hay múltiples resultados, seleccionar
         if len(colegios) > 1:
@@ -382,8 +642,8 @@ def borrar_colegio_api() -> bool:
         cliente_api.eliminar_colegio(id_colegio)
         print(f"\nColegio '{colegio_borrar.get('Colegio')}' borrado correctamente de la API.")
         
-        # Sincronizar estructura jerárquica local después de borrar en API
-        _sincronizar_api_con_local()
+        # Sincronizar estructura jerárquica local (en segundo plano) después de borrar en API
+        _programar_sincronizacion("borrar", colegio_borrar)
         
         return True
 
@@ -9,13 +9,66 @@ Este módulo proporciona funciones para:
 
 import csv
 import os
+import sys
 import unicodedata
-from typing import List, Dict, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
+# Columnas del archivo CSV, en orden.
+CAMPOS_CSV = ["Provincia", "Colegio", "Cantidad de Estudiantes", "Año de Creación"]
+
+# Extrae los valores de un colegio en el orden de CAMPOS_CSV; descarta las
+# claves auxiliares (ej.: '_n_col', 'id')
+_CAMPOS_FILA = itemgetter(*CAMPOS_CSV)
+
+
+def _sin_marcas(texto: str) -> str:
+    """Descompone el texto (NFD) y quita las marcas combinantes (acentos).
+
+    Los caracteres ASCII nunca son marcas: se conservan sin consultar
+    `unicodedata.category`, que solo se llama para el resto.
+    """
+    texto = unicodedata.normalize('NFD', texto)
+    return ''.join(c for c in texto if c < '\x80' or unicodedata.category(c) != 'Mn')
+
+
+def _crear_tabla_acentos() -> Dict[int, Optional[str]]:
+    """Arma la tabla de `str.translate` para las letras latinas con acento.
+
+    Recorre los bloques latinos (U+00C0 a U+024F) y guarda cada letra cuya
+    versión sin marcas es ASCII, así la tabla da exactamente el mismo
+    resultado que la descomposición completa para esas letras.
+
+    Returns:
+        dict[int, str | None]: Tabla de traducción de `str.maketrans` (código -> letra sin acento).
+    """
+    tabla = {}
+    for codigo in range(0x00C0, 0x0250):
+        letra = chr(codigo)
+        base = _sin_marcas(letra)
+        if base != letra and base.isascii():
+            tabla[codigo] = base
+    return str.maketrans(tabla)
+
+
+# Tabla para quitar los acentos latinos con una sola llamada a str.translate
+_TABLA_ACENTOS = _crear_tabla_acentos()
+
+
+@lru_cache(maxsize=8192)
 def normalizar(texto: str) -> str:
     """Convierte texto a minúsculas, elimina espacios y acentos.
 
+    El texto ASCII (el caso más común) ya no tiene acentos y se devuelve
+    enseguida. Si no, los acentos de las letras latinas se quitan con una
+    tabla de traducción, y solo si después queda algún carácter no ASCII se
+    recurre a la descomposición Unicode completa.
+
+    El resultado se cachea: las provincias (y los nombres que se repiten) se
+    normalizan una sola vez aunque aparezcan en miles de filas.
+
     Args:
         texto (str): Texto a normalizar.
 
@@ -25,92 +78,221 @@ def normalizar(texto: str) -> str:
     if not texto:
         return ""
     texto = str(texto).lower().strip()
-    texto = unicodedata.normalize('NFD', texto)
-    texto = ''.join(c for c in texto if unicodedata.category(c) != 'Mn')
-    return texto
+    if texto.isascii():
+        return texto
+    texto = texto.translate(_TABLA_ACENTOS)
+    if texto.isascii():
+        return texto
+    return _sin_marcas(texto)
+
+
+def preparar_colegio(colegio: Dict) -> Dict:
+    """Completa el esquema del colegio y agrega nombre y provincia normalizados.
+
+    Garantiza que existan las cuatro claves del CSV (con valores por defecto si
+    faltan) y que tengan los tipos del esquema (str, str, int, int), de modo que
+    los filtros y los escritores de CSV puedan usarlas directamente sin `.get()`
+    ni conversiones.
+    Las búsquedas comparan contra `_n_col` y `_n_prov` en lugar de normalizar
+    cada fila en cada consulta. Debe volver a llamarse cada vez que se modifique
+    el nombre o la provincia del colegio.
+
+    Args:
+        colegio (dict): Diccionario del colegio (se modifica en el lugar).
+
+    Returns:
+        dict: El mismo diccionario recibido.
+
+    Raises:
+        ValueError: Si un campo numérico no se puede convertir a entero.
+    """
+    for campo in ("Provincia", "Colegio"):
+        valor = colegio.get(campo)
+        if not isinstance(valor, str):
+            colegio[campo] = "" if valor is None else str(valor)
+    for campo in ("Cantidad de Estudiantes", "Año de Creación"):
+        valor = colegio.get(campo)
+        if not isinstance(valor, int):
+            colegio[campo] = 0 if valor is None or valor == "" else int(valor)
+    colegio["_n_col"] = normalizar(colegio["Colegio"])
+    colegio["_n_prov"] = normalizar(colegio["Provincia"])
+    return colegio
+
+
+def iterar_filas_csv(archivo, avisar: bool = True) -> Iterator[Tuple[str, str, int, int]]:
+    """Recorre un CSV de colegios abierto y devuelve sus filas válidas.
+
+    Es el analizador común de `iterar_csv` y de los subgrupos de `jerarquia`:
+    toma las columnas por posición según el encabezado (en cualquier orden),
+    quita los espacios y convierte los números. Las filas con formato
+    incorrecto se omiten. Si al encabezado le falta alguna columna de
+    `CAMPOS_CSV` no devuelve nada.
+
+    Args:
+        archivo: Archivo CSV abierto en modo texto.
+        avisar (bool): Si True, informa las columnas faltantes y, al terminar
+            el recorrido, cuántas filas se omitieron.
+
+    Yields:
+        tuple: (provincia, colegio, cantidad de estudiantes, año de creación).
+
+    Raises:
+        csv.Error: Si el archivo no es un CSV válido.
+    """
+    # csv.reader devuelve listas; se indexa por posición en lugar de
+    # construir un diccionario intermedio por fila como DictReader
+    lector = csv.reader(archivo)
+    encabezado = [nombre.strip() for nombre in next(lector, [])]
+
+    faltantes = [campo for campo in CAMPOS_CSV if campo not in encabezado]
+    if faltantes:
+        if avisar and encabezado:
+            print(f"⚠️ Al archivo CSV le faltan las columnas: {', '.join(faltantes)}")
+        return
+
+    # Extrae las cuatro columnas de la fila en una sola llamada en C
+    campos_fila = itemgetter(*(encabezado.index(campo) for campo in CAMPOS_CSV))
+    filas_invalidas = 0
+
+    for fila in lector:
+        if not fila:
+            continue
+        try:
+            provincia, colegio, cantidad_str, año_str = campos_fila(fila)
+            # Pocas provincias distintas: todas las filas comparten el mismo objeto
+            provincia = sys.intern(provincia.strip())
+            colegio = colegio.strip()
+            if not provincia or not colegio:
+                filas_invalidas += 1
+                continue
+
+            cantidad_estudiantes = int(cantidad_str) if cantidad_str.strip() else 0
+            año_creacion = int(año_str) if año_str.strip() else 0
+        except (IndexError, ValueError):
+            # Fila con menos columnas o con un número inválido
+            filas_invalidas += 1
+            continue
+
+        yield provincia, colegio, cantidad_estudiantes, año_creacion
+
+    if avisar and filas_invalidas > 0:
+        print(f"⚠️ Se omitieron {filas_invalidas} fila(s) con formato incorrecto.")
+
+
+def iterar_csv(ruta_csv: str) -> Iterator[Dict]:
+    """Recorre los colegios de un archivo CSV de a uno, sin armar la lista.
+
+    Sirve para recorridos de una sola pasada sobre archivos grandes: en
+    memoria hay una fila por vez. Cada colegio tiene la misma forma que en
+    `leer_csv`. Las filas con formato incorrecto se omiten y, al terminar el
+    recorrido, se informa cuántas fueron (ver `iterar_filas_csv`).
+
+    Args:
+        ruta_csv (str): Ruta al archivo CSV.
+
+    Yields:
+        dict: Un colegio por vez, con las claves de `CAMPOS_CSV` y '_n_col' y '_n_prov'.
+
+    Raises:
+        OSError: Si el archivo no se puede leer.
+        csv.Error: Si el archivo no es un CSV válido.
+    """
+    if not os.path.exists(ruta_csv):
+        return
+
+    # Buffer de 1 MiB: menos llamadas a read y lecturas secuenciales grandes
+    with open(ruta_csv, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20) as archivo:
+        for provincia, colegio, cantidad_estudiantes, año_creacion in iterar_filas_csv(archivo):
+            # Los tipos ya son los del esquema: se agregan directamente las
+            # claves normalizadas que calcularía `preparar_colegio`
+            yield {
+                "Provincia": provincia,
+                "Colegio": colegio,
+                "Cantidad de Estudiantes": cantidad_estudiantes,
+                "Año de Creación": año_creacion,
+                "_n_col": normalizar(colegio),
+                "_n_prov": normalizar(provincia),
+            }
 
 
 def leer_csv(ruta_csv: str) -> List[Dict]:
     """Lee colegios desde un archivo CSV y retorna lista de diccionarios.
 
     Usa los nombres reales del CSV: Provincia, Colegio, Cantidad de Estudiantes, Año de Creación.
+    Es la versión en lista de `iterar_csv`.
 
     Args:
         ruta_csv (str): Ruta al archivo CSV.
 
     Returns:
-        list[dict]: Lista de diccionarios con los colegios. Cada diccionario tiene:
+        list[dict]: Lista de diccionarios con los colegios (vacía si el archivo no
+            existe o no se puede leer). Cada diccionario tiene:
             - 'Provincia' (str)
             - 'Colegio' (str)
             - 'Cantidad de Estudiantes' (int)
             - 'Año de Creación' (int)
+            - '_n_col' y '_n_prov' (str): nombre y provincia normalizados
     """
-    colegios = []
-    filas_invalidas = 0
+    try:
+        return list(iterar_csv(ruta_csv))
+    except Exception as e:
+        print(f"⚠️ Error al leer el archivo CSV: {e}")
+        return []
 
-    if not os.path.exists(ruta_csv):
-        return colegios
 
+def _sincronizar_jerarquia(ruta_csv: str, colegios: List[Dict]) -> None:
+    """Sincroniza los subgrupos jerárquicos con el archivo central, si el módulo existe.
+
+    Args:
+        ruta_csv (str): Ruta del CSV central.
+        colegios (list[dict]): Lista completa de colegios.
+    """
     try:
-        with open(ruta_csv, 'r', encoding='utf-8-sig', newline='') as archivo:
-            lector = csv.DictReader(archivo)
-
-            for fila in lector:
-                try:
-                    provincia = fila.get("Provincia", "").strip()
-                    colegio = fila.get("Colegio", "").strip()
-                    cantidad_str = fila.get("Cantidad de Estudiantes", "").strip()
-                    año_str = fila.get("Año de Creación", "").strip()
-
-                    if not provincia or not colegio:
-                        filas_invalidas += 1
-                        continue
-
-                    # Convertir campos numéricos
-                    try:
-                        cantidad_estudiantes = int(cantidad_str) if cantidad_str else 0
-                        año_creacion = int(año_str) if año_str else 0
-                    except ValueError:
-                        filas_invalidas += 1
-                        continue
-
-                    colegio_dict = {
-                        "Provincia": provincia,
-                        "Colegio": colegio,
-                        "Cantidad de Estudiantes": cantidad_estudiantes,
-                        "Año de Creación": año_creacion
-                    }
-
-                    colegios.append(colegio_dict)
-
-                except Exception:
-                    filas_invalidas += 1
-                    continue
+        from funciones.jerarquia import sincronizar_estructura_jerarquica
+        sincronizar_estructura_jerarquica(colegios, ruta_csv)
+    except ImportError:
+        # Si el módulo jerarquia no está disponible, continuar sin sincronización
+        pass
 
-        if filas_invalidas > 0:
-            print(f"⚠️ Se omitieron {filas_invalidas} fila(s) con formato incorrecto.")
 
-    except Exception as e:
-        print(f"⚠️ Error al leer el archivo CSV: {e}")
-        return []
+def _sincronizar_jerarquia_desde_archivo(ruta_csv: str) -> None:
+    """Sincroniza los subgrupos jerárquicos leyendo el CSV central fila a fila.
 
-    return colegios
+    Args:
+        ruta_csv (str): Ruta del CSV central.
+    """
+    try:
+        from funciones.jerarquia import sincronizar_desde_archivo
+        sincronizar_desde_archivo(ruta_csv)
+    except ImportError:
+        # Si el módulo jerarquia no está disponible, continuar sin estructura jerárquica
+        pass
+    except Exception as e:
+        print(f"⚠️  No se pudo sincronizar estructura jerárquica: {e}")
 
 
 def escribir_csv(ruta_csv: str, colegios: List[Dict]) -> bool:
     """Escribe la lista de colegios a un archivo CSV.
 
+    El contenido se escribe primero en un archivo temporal que luego reemplaza
+    al original con `os.replace`, así una falla a mitad de escritura no deja
+    el CSV corrupto.
+
     Además, sincroniza la estructura jerárquica de subgrupos organizando
     los datos en subcarpetas por provincia, cantidad de estudiantes y año.
 
+    Las filas se extraen con `itemgetter` y se escriben con una sola llamada
+    a `writerows`, sin pasar por `DictWriter`, que arma cada fila en Python.
+
     Args:
         ruta_csv (str): Ruta donde guardar el CSV.
-        colegios (list[dict]): Lista de diccionarios con los colegios.
+        colegios (list[dict]): Lista de diccionarios con los colegios (con las
+            cuatro claves de `CAMPOS_CSV`, ver `preparar_colegio`).
 
     Returns:
         bool: True si se escribió correctamente, False en caso contrario.
     """
-    campos = ["Provincia", "Colegio", "Cantidad de Estudiantes", "Año de Creación"]
+    ruta_tmp = ruta_csv + ".tmp"
 
     try:
         # Asegurar que el directorio existe
@@ -118,18 +300,119 @@ def escribir_csv(ruta_csv: str, colegios: List[Dict]) -> bool:
         if directorio and not os.path.exists(directorio):
             os.makedirs(directorio, exist_ok=True)
 
-        with open(ruta_csv, 'w', encoding='utf-8-sig', newline='') as archivo:
-            escritor = csv.DictWriter(archivo, fieldnames=campos)
-            escritor.writeheader()
-            escritor.writerows(colegios)
+        # Buffer de 1 MiB: menos llamadas a write y escrituras secuenciales grandes
+        with open(ruta_tmp, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(CAMPOS_CSV)
+            escritor.writerows(map(_CAMPOS_FILA, colegios))
+            # Asegurar que los datos están en disco antes de reemplazar el original
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_tmp, ruta_csv)
 
         # Sincronizar estructura jerárquica después de escribir el archivo central
-        try:
-            from funciones.jerarquia import sincronizar_estructura_jerarquica
-            sincronizar_estructura_jerarquica(colegios, ruta_csv)
-        except ImportError:
-            # Si el módulo jerarquia no está disponible, continuar sin sincronización
-            pass
+        _sincronizar_jerarquia(ruta_csv, colegios)
+
+        return True
+
+    except Exception as e:
+        print(f"⚠️ Error al escribir el archivo CSV: {e}")
+        if os.path.exists(ruta_tmp):
+            os.remove(ruta_tmp)
+        return False
+
+
+def escribir_csv_en_streaming(ruta_csv: str, colegios: Iterable[Dict]) -> bool:
+    """Escribe en el CSV colegios que llegan de a uno, sin armar una lista.
+
+    Igual que `escribir_csv`, escribe en un archivo temporal que reemplaza al
+    original. Si no llega ningún colegio, el archivo original no se toca. La
+    estructura jerárquica se sincroniza después leyendo el CSV fila a fila.
+
+    Args:
+        ruta_csv (str): Ruta donde guardar el CSV.
+        colegios (iterable[dict]): Colegios a escribir (por ejemplo, un
+            generador), con las cuatro claves de `CAMPOS_CSV`.
+
+    Returns:
+        bool: True si se escribió al menos un colegio, False en caso contrario.
+    """
+    filas = map(_CAMPOS_FILA, colegios)
+    ruta_tmp = ruta_csv + ".tmp"
+
+    try:
+        primera = next(filas, None)
+        if primera is None:
+            return False
+
+        directorio = os.path.dirname(ruta_csv)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+        with open(ruta_tmp, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(CAMPOS_CSV)
+            escritor.writerow(primera)
+            escritor.writerows(filas)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_tmp, ruta_csv)
+
+    except Exception as e:
+        print(f"⚠️ Error al escribir el archivo CSV: {e}")
+        if os.path.exists(ruta_tmp):
+            os.remove(ruta_tmp)
+        return False
+
+    _sincronizar_jerarquia_desde_archivo(ruta_csv)
+
+    return True
+
+
+def agregar_fila_csv(ruta_csv: str, colegio: Dict, colegios: Optional[List[Dict]] = None) -> bool:
+    """Agrega un colegio al final del CSV sin reescribir el archivo completo.
+
+    Si el archivo no existe o está vacío, se escribe completo con `escribir_csv`.
+    La fila respeta el orden de columnas del encabezado del archivo. Después
+    de agregarla se sincroniza la estructura jerárquica: desde `colegios` si
+    se pasa la lista, o leyendo el CSV fila a fila si no.
+
+    Args:
+        ruta_csv (str): Ruta del CSV.
+        colegio (dict): Colegio a agregar.
+        colegios (list[dict] | None): Lista completa de colegios (ya incluye
+            `colegio`), o None si el llamador no la tiene en memoria.
+
+    Returns:
+        bool: True si se escribió correctamente, False en caso contrario.
+    """
+    if not os.path.exists(ruta_csv) or os.path.getsize(ruta_csv) == 0:
+        return escribir_csv(ruta_csv, colegios if colegios is not None else [colegio])
+
+    try:
+        # La fila se escribe en el orden de columnas del encabezado del archivo,
+        # que `iterar_csv` acepta en cualquier orden
+        with open(ruta_csv, 'r', encoding='utf-8-sig', newline='') as archivo:
+            encabezado = [nombre.strip() for nombre in next(csv.reader(archivo), [])]
+        fila = _CAMPOS_FILA(colegio)
+        if encabezado != CAMPOS_CSV and all(campo in encabezado for campo in CAMPOS_CSV):
+            valores = dict(zip(CAMPOS_CSV, fila))
+            fila = [valores.get(nombre, '') for nombre in encabezado]
+
+        # Si la última línea no termina en salto de línea, agregarlo antes
+        with open(ruta_csv, 'rb') as archivo:
+            archivo.seek(-1, os.SEEK_END)
+            falta_salto = archivo.read(1) not in (b"\n", b"\r")
+
+        with open(ruta_csv, 'a', encoding='utf-8', newline='') as archivo:
+            if falta_salto:
+                archivo.write("\r\n")
+            csv.writer(archivo).writerow(fila)
+
+        if colegios is None:
+            _sincronizar_jerarquia_desde_archivo(ruta_csv)
+        else:
+            _sincronizar_jerarquia(ruta_csv, colegios)
 
         return True
 
@@ -138,35 +421,106 @@ def escribir_csv(ruta_csv: str, colegios: List[Dict]) -> bool:
         return False
 
 
+def reemplazar_fila_csv(ruta_csv: str, fila_buscada: tuple, colegio: Optional[Dict]) -> bool:
+    """Reemplaza o borra una fila del CSV reescribiéndolo en streaming.
+
+    Recorre el archivo con `iterar_csv` y copia cada fila a un archivo
+    temporal, salvo la primera igual a `fila_buscada`, que se reemplaza por
+    `colegio` (o se omite si es None). Solo hay una fila en memoria por vez.
+    Si la fila no está, el archivo original no se toca.
+
+    Args:
+        ruta_csv (str): Ruta del CSV.
+        fila_buscada (tuple): Valores de la fila en el orden de `CAMPOS_CSV`.
+        colegio (dict | None): Colegio que reemplaza a la fila, o None para borrarla.
+
+    Returns:
+        bool: True si se encontró la fila y se reescribió el archivo, False en
+            caso contrario.
+    """
+    ruta_tmp = ruta_csv + ".tmp"
+    encontrada = False
+
+    try:
+        with open(ruta_tmp, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(CAMPOS_CSV)
+            for fila in map(_CAMPOS_FILA, iterar_csv(ruta_csv)):
+                if not encontrada and fila == fila_buscada:
+                    encontrada = True
+                    if colegio is not None:
+                        escritor.writerow(_CAMPOS_FILA(colegio))
+                    continue
+                escritor.writerow(fila)
+            if encontrada:
+                archivo.flush()
+                os.fsync(archivo.fileno())
+
+        if not encontrada:
+            os.remove(ruta_tmp)
+            return False
+        os.replace(ruta_tmp, ruta_csv)
+
+    except Exception as e:
+        print(f"⚠️ Error al escribir el archivo CSV: {e}")
+        if os.path.exists(ruta_tmp):
+            os.remove(ruta_tmp)
+        return False
+
+    _sincronizar_jerarquia_desde_archivo(ruta_csv)
+
+    return True
+
+
 def limpiar_consola():
     """Limpia la consola."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
+# Los menús se arman una sola vez y se imprimen con un único `print`
+_MENU_PRINCIPAL = "\n".join((
+    "",
+    "-----MENÚ PRINCIPAL - GESTIÓN DE COLEGIOS-----",
+    "CONSULTAS Y BÚSQUEDAS: ",
+    "1.  Buscar colegio por nombre",
+    "2.  Listar colegios por provincia",
+    "3.  Filtrar por cantidad de estudiantes",
+    "4.  Filtrar por año de fundación",
+    "ORGANIZACIÓN Y ANÁLISIS:",
+    "5.  Ordenar lista de colegios",
+    "6.  Ver estadísticas generales",
+    "ADMINISTRACIÓN DE DATOS:",
+    "7. Registrar nuevo colegio",
+    "8. Modificar datos de colegio",
+    "9. Eliminar colegio del sistema",
+    "CONFIGURACIÓN:",
+    "10. Cambiar fuente de datos (Local/API)",
+    "11. Salir del programa",
+))
+
+_MENU_MODO = "\n".join((
+    "",
+    "╔══════════════════════════════════════════════════════════╗",
+    "║          SELECCIÓN DE FUENTE DE DATOS                    ║",
+    "╠══════════════════════════════════════════════════════════╣",
+    "║  1. 💾 Archivo CSV local                                 ║",
+    "║     └─ Trabaja con datos almacenados en este equipo      ║",
+    "║                                                           ║",
+    "║  2. 🌐 Servidor API remoto                               ║",
+    "║     └─ Conecta con servidor en http://149.50.150.15:8020 ║",
+    "║                                                           ║",
+    "║  3. ❌ Cancelar y salir                                  ║",
+    "╚══════════════════════════════════════════════════════════╝",
+))
+
+
 def menu_principal() -> int:
     """Muestra el menú principal de operaciones y devuelve la opción elegida.
 
     Returns:
         int: Número de opción (1 a 11).
     """
-    print("")
-
-    print("-----MENÚ PRINCIPAL - GESTIÓN DE COLEGIOS-----")
-    print("CONSULTAS Y BÚSQUEDAS: ")
-    print("1.  Buscar colegio por nombre")
-    print("2.  Listar colegios por provincia")
-    print("3.  Filtrar por cantidad de estudiantes")
-    print("4.  Filtrar por año de fundación")
-    print("ORGANIZACIÓN Y ANÁLISIS:")
-    print("5.  Ordenar lista de colegios")
-    print("6.  Ver estadísticas generales")
-    print("ADMINISTRACIÓN DE DATOS:")
-    print("7. Registrar nuevo colegio")
-    print("8. Modificar datos de colegio")
-    print("9. Eliminar colegio del sistema")
-    print("CONFIGURACIÓN:")
-    print("10. Cambiar fuente de datos (Local/API)")
-    print("11. Salir del programa")
+    print(_MENU_PRINCIPAL)
 
     try:
         opcion = int(input("\n👉 Seleccione una opción (1-11): "))
@@ -182,18 +536,7 @@ def seleccionar_modo() -> int:
     Returns:
         int: 1 para local, 2 para API, 3 para salir.
     """
-    print("")
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║          SELECCIÓN DE FUENTE DE DATOS                    ║")
-    print("╠══════════════════════════════════════════════════════════╣")
-    print("║  1. 💾 Archivo CSV local                                 ║")
-    print("║     └─ Trabaja con datos almacenados en este equipo      ║")
-    print("║                                                           ║")
-    print("║  2. 🌐 Servidor API remoto                               ║")
-    print("║     └─ Conecta con servidor en http://149.50.150.15:8020 ║")
-    print("║                                                           ║")
-    print("║  3. ❌ Cancelar y salir                                  ║")
-    print("╚══════════════════════════════════════════════════════════╝")
+    print(_MENU_MODO)
 
     try:
         op = int(input("\n👉 Elija una opción (1, 2 o 3): "))
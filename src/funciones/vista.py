@@ -1,38 +1,57 @@
 """Funciones para mostrar y ordenar colegios."""
 
-from typing import List, Dict
-from funciones.utilidades import normalizar
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple
+
+
+# Campo de texto -> clave con su versión normalizada (ver `preparar_colegio`)
+_CLAVES_NORMALIZADAS = {"Provincia": "_n_prov", "Colegio": "_n_col"}
+
+# Ordenamientos ya calculados: (campo, descendente) -> lista ordenada.
+# Solo son válidos para la lista `_orden_lista`; si cambia, se descartan.
+_cache_orden: Dict[Tuple[str, bool], List[Dict]] = {}
+_orden_lista: Optional[List[Dict]] = None
+
+
+def invalidar_cache_orden() -> None:
+    """Descarta los ordenamientos guardados.
+
+    Debe llamarse antes de modificar la lista de colegios (agregar, editar o borrar).
+    """
+    global _orden_lista
+    _cache_orden.clear()
+    _orden_lista = None
 
 
 def mostrar_colegios_recursivo(colegios: List[Dict], indice: int = 0) -> None:
-    """Muestra los colegios de forma recursiva.
+    """Muestra los colegios desde la posición `indice`.
 
-    Implementación recursiva para cumplir con los requisitos del proyecto.
+    Conserva el nombre y la firma de la versión recursiva original, pero
+    recorre la lista con un bucle: no crea un marco de pila por colegio ni
+    falla con `RecursionError` en listas de más de ~1000 colegios. Las líneas
+    se arman primero y se imprimen con un solo `print`.
 
     Args:
         colegios (list[dict]): Lista de diccionarios con colegios.
-        indice (int): Índice actual en la lista (para recursión).
+        indice (int): Índice desde el cual empezar a mostrar.
     """
-    # Caso base: se recorrió toda la lista
-    if indice >= len(colegios):
-        return
-
-    # Procesar el elemento actual
-    c = colegios[indice]
-    provincia = c.get("Provincia", "")
-    colegio = c.get("Colegio", "")
-    cantidad = c.get("Cantidad de Estudiantes", 0)
-    año = c.get("Año de Creación", 0)
-    print(f"  🏫 {colegio} | Provincia: {provincia} | Estudiantes: {cantidad:,} | Año: {año}")
+    lineas = []
+    for c in islice(colegios, indice, None):
+        provincia = c.get("Provincia", "")
+        colegio = c.get("Colegio", "")
+        cantidad = c.get("Cantidad de Estudiantes", 0)
+        año = c.get("Año de Creación", 0)
+        lineas.append(f"  🏫 {colegio} | Provincia: {provincia} | Estudiantes: {cantidad:,} | Año: {año}")
 
-    # Llamada recursiva para el siguiente elemento
-    mostrar_colegios_recursivo(colegios, indice + 1)
+    if lineas:
+        print("\n".join(lineas))
 
 
 def mostrar_colegios(colegios: List[Dict]) -> None:
     """Muestra los colegios con todos sus datos de forma prolija.
 
-    Esta función utiliza la implementación recursiva internamente.
+    Usa `mostrar_colegios_recursivo` internamente.
 
     Args:
         colegios (list[dict]): Lista de diccionarios con colegios.
@@ -41,15 +60,18 @@ def mostrar_colegios(colegios: List[Dict]) -> None:
         print("  No hay colegios para mostrar.")
         return
 
-    # Usar función recursiva
     mostrar_colegios_recursivo(colegios)
 
 
 def ordenar_colegios(colegios: List[Dict], campo: str, descendente: bool = False) -> List[Dict]:
     """Ordena la lista de colegios por el campo especificado.
 
+    Cada combinación de campo y sentido se ordena una sola vez por lista; las
+    siguientes llamadas devuelven una copia del resultado guardado.
+
     Args:
-        colegios (list[dict]): Lista de colegios a ordenar.
+        colegios (list[dict]): Lista de colegios a ordenar (preparados con
+            `preparar_colegio`).
         campo (str): Campo por el cual ordenar. Opciones: 'Provincia', 'Colegio',
             'Cantidad de Estudiantes', 'Año de Creación'.
         descendente (bool): Si True, orden descendente; si False, ascendente.
@@ -66,17 +88,20 @@ def ordenar_colegios(colegios: List[Dict], campo: str, descendente: bool = False
         print(f"⚠️ Campo inválido. Campos válidos: {', '.join(campos_validos)}")
         return colegios
 
+    global _orden_lista
+    if colegios is not _orden_lista:
+        _cache_orden.clear()
+        _orden_lista = colegios
+
     try:
-        # Ordenar
-        colegios_ordenados = sorted(
-            colegios,
-            key=lambda x: (
-                normalizar(x.get(campo, "")) if campo in ["Provincia", "Colegio"]
-                else x.get(campo, 0)
-            ),
-            reverse=descendente
-        )
-        return colegios_ordenados
+        colegios_ordenados = _cache_orden.get((campo, descendente))
+        if colegios_ordenados is None:
+            # Los campos de texto se comparan por su versión normalizada, ya
+            # calculada por `preparar_colegio`
+            clave = _CLAVES_NORMALIZADAS.get(campo, campo)
+            colegios_ordenados = sorted(colegios, key=itemgetter(clave), reverse=descendente)
+            _cache_orden[(campo, descendente)] = colegios_ordenados
+        return list(colegios_ordenados)
     except Exception as e:
         print(f"⚠️ Error al ordenar: {e}")
         return colegios